@@ -3,9 +3,12 @@ BTC Backtest - Historical analysis of Buy the Dip strategy
 Multiple drop detection methods with recovery analysis
 """
 
+import numpy as np
 import pandas as pd
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from numpy.lib.stride_tricks import sliding_window_view
 from typing import List, Dict
-from btc_monitor.binance_api import BinanceClient
+from btc_monitor.binance_api import BinanceClient, create_session
 from btc_monitor.indicators import find_drops_advanced
 from btc_monitor import settings
 from btc_monitor.views.backtest import (
@@ -15,78 +18,81 @@ from btc_monitor.views.backtest import (
     format_recent_opportunities,
     format_error_no_data,
     format_no_drops_found,
-    format_completion_message
+    format_completion_message,
+    format_grid_summary
 )
 
 
 def analyze_recovery(df: pd.DataFrame, drops: pd.DataFrame, days_ahead: int = 7) -> List[Dict]:
     """Analyze price recovery after drops"""
-    results = []
-
-    for idx, drop_row in drops.iterrows():
-        drop_date = drop_row['date']
-        drop_price = drop_row['close']
-        drop_change = drop_row['change_close']
-        drop_tipo = drop_row.get('tipo', 'Unknown')
-
-        # Get following days
-        future_data = df[df['date'] > drop_date].head(days_ahead)
-
-        if len(future_data) == 0:
-            continue
-
-        # Find recovery
-        recovery_day = None
-        recovery_price = None
-        max_gain = 0
-        max_gain_day = None
-
-        for future_idx, future_row in future_data.iterrows():
-            days_passed = (future_row['date'] - drop_date).days
-            current_price = future_row['close']
-            gain = ((current_price - drop_price) / drop_price) * 100
-
-            if recovery_day is None and current_price > drop_price:
-                recovery_day = days_passed
-                recovery_price = current_price
-
-            if gain > max_gain:
-                max_gain = gain
-                max_gain_day = days_passed
+    if len(drops) == 0:
+        return []
+
+    # Extract columns once; df is sorted by timestamp so each drop's following
+    # days are a contiguous slice starting right after its position
+    closes = df['close'].to_numpy(dtype=np.float64)
+    starts = np.searchsorted(df['timestamp'].to_numpy(), drops['timestamp'].to_numpy(), side='right')
+
+    # Skip drops with no following days
+    has_future = starts < len(closes)
+    starts = starts[has_future]
+    drop_dates = pd.DatetimeIndex(drops['timestamp'].to_numpy()[has_future])
+    drop_prices = drops['close'].to_numpy(dtype=np.float64)[has_future]
+    drop_changes = drops['change_close'].to_numpy()[has_future]
+    if 'tipo' in drops.columns:
+        drop_tipos = drops['tipo'].to_numpy()[has_future]
+    else:
+        drop_tipos = np.full(len(starts), 'Unknown', dtype=object)
+
+    # Gather all forward windows at once: (drops x days_ahead), NaN past the end.
+    # The window view is zero-copy; only the selected drop rows are materialized
+    padded = np.concatenate([closes, np.full(days_ahead, np.nan)])
+    future_closes = sliding_window_view(padded, days_ahead)[starts]
+    gains = ((future_closes - drop_prices[:, None]) / drop_prices[:, None]) * 100
+
+    # First close above drop price (days counted from 1)
+    recovered = future_closes > drop_prices[:, None]
+    has_recovery = recovered.any(axis=1)
+    recovery_idx = recovered.argmax(axis=1)
+
+    # Best gain in window (argmax keeps the earliest day on ties)
+    rows = np.arange(len(starts))
+    best_idx = np.nanargmax(gains, axis=1)
+    best_gains = gains[rows, best_idx]
+    has_gain = best_gains > 0
 
+    results = []
+    for i in rows:
+        recovery_day = int(recovery_idx[i]) + 1 if has_recovery[i] else None
         results.append({
-            'date': drop_date,
-            'tipo': drop_tipo,
-            'drop_percent': drop_change,
-            'drop_price': drop_price,
+            'date': drop_dates[i],
+            'tipo': drop_tipos[i],
+            'drop_percent': drop_changes[i],
+            'drop_price': drop_prices[i],
             'recovery_days': recovery_day,
-            'recovery_price': recovery_price,
-            'max_gain_percent': max_gain,
-            'max_gain_days': max_gain_day,
+            'recovery_price': future_closes[i, recovery_idx[i]] if has_recovery[i] else None,
+            'max_gain_percent': best_gains[i] if has_gain[i] else 0,
+            'max_gain_days': int(best_idx[i]) + 1 if has_gain[i] else None,
             'recovered': recovery_day is not None
         })
 
     return results
 
 
-def print_statistics(results: List[Dict]):
+def print_statistics(df_results: pd.DataFrame):
     """Print comprehensive statistics"""
-    output = format_statistics(results)
+    output = format_statistics(df_results)
     print(output, end="")
 
-    if len(results) > 0:
-        return pd.DataFrame(results)
-    return None
-
 
-def print_recent_opportunities(results: List[Dict], n: int = 10):
+def print_recent_opportunities(df_results: pd.DataFrame, n: int = 10):
     """Show recent detected drops"""
-    output = format_recent_opportunities(results, n)
+    output = format_recent_opportunities(df_results, n)
     print(output, end="")
 
 
-def run_backtest(days: int = 180, min_drop: float = None):
-    """Execute complete backtest analysis"""
+def run_backtest(days: int = 180, min_drop: float = None, df: pd.DataFrame = None):
+    """Execute complete backtest analysis (pass df to reuse already downloaded klines)"""
     if min_drop is None:
         min_drop = settings.MIN_DROP
 
@@ -94,18 +100,24 @@ def run_backtest(days: int = 180, min_drop: float = None):
     startup_info = format_backtest_startup_info(settings.SYMBOL, days, min_drop)
     print(startup_info)
 
-    # Initialize client
-    client = BinanceClient(symbol=settings.SYMBOL, base_url="https://api.binance.com")
+    if df is None:
+        # Initialize client
+        client = BinanceClient(
+            symbol=settings.SYMBOL,
+            base_url="https://api.binance.com",
+            cache_dir=settings.CACHE_DIR,
+            cache_ttl=settings.CACHE_TTL
+        )
 
-    # Fetch historical data
-    print(f"📥 Downloading {days} days of historical data...")
-    df = client.get_historical_with_retry(days)
+        # Fetch historical data
+        print(f"📥 Downloading {days} days of historical data...")
+        df = client.get_historical_with_retry(days)
 
-    if df is None or len(df) == 0:
-        print(format_error_no_data())
-        return None, None
+        if df is None or len(df) == 0:
+            print(format_error_no_data())
+            return None, None
 
-    print(f"✅ {len(df)} days downloaded\n")
+        print(f"✅ {len(df)} days downloaded\n")
 
     # Find drops
     drops = find_drops_advanced(df, min_drop)
@@ -120,13 +132,85 @@ def run_backtest(days: int = 180, min_drop: float = None):
     print(f"⏳ Analyzing drop recovery...\n")
     results = analyze_recovery(df, drops)
 
+    # Build the results frame once and share it between reports
+    df_results = pd.DataFrame(results)
+
     # Print statistics
-    df_results = print_statistics(results)
+    print_statistics(df_results)
 
     # Recent opportunities
-    print_recent_opportunities(results)
+    print_recent_opportunities(df_results)
+
+    return df, (df_results if len(df_results) > 0 else None)
+
+
+def _grid_worker(symbol: str, min_drop: float, df: pd.DataFrame) -> Dict:
+    """Run detection + recovery for one grid combination and summarize it (worker process)"""
+    drops = find_drops_advanced(df, min_drop)
+    df_results = pd.DataFrame(analyze_recovery(df, drops))
+
+    summary = {'symbol': symbol, 'min_drop': min_drop, 'drops': len(df_results),
+               'recovery_rate': np.nan, 'avg_gain': np.nan}
+    if len(df_results) > 0:
+        summary['recovery_rate'] = df_results['recovered'].mean() * 100
+        summary['avg_gain'] = df_results.loc[df_results['max_gain_days'].notna(), 'max_gain_percent'].mean()
+    return summary
+
+
+def run_backtest_grid(symbols: List[str] = None, min_drops: List[float] = None,
+                      days: int = 180) -> pd.DataFrame:
+    """
+    Backtest every (symbol, min_drop) combination in parallel
+
+    Klines are downloaded once per symbol (through the klines cache), then each
+    combination is analyzed in a separate worker process.
+
+    Args:
+        symbols: Trading symbols (defaults to settings.SYMBOLS)
+        min_drops: Minimum drop percentages (defaults to settings.MIN_DROP)
+        days: Number of days to analyze
+
+    Returns:
+        Summary DataFrame with one row per combination
+    """
+    if symbols is None:
+        symbols = settings.SYMBOLS
+    if min_drops is None:
+        min_drops = [settings.MIN_DROP]
+
+    klines = {}
+    session = create_session()
+    for symbol in symbols:
+        client = BinanceClient(
+            symbol=symbol,
+            base_url="https://api.binance.com",
+            cache_dir=settings.CACHE_DIR,
+            cache_ttl=settings.CACHE_TTL,
+            session=session
+        )
+
+        print(f"📥 Downloading {days} days of historical data for {symbol}...")
+        df = client.get_historical_with_retry(days)
+        if df is None or len(df) == 0:
+            print(f"❌ Unable to obtain data for {symbol}, skipping")
+            continue
+        klines[symbol] = df
+
+    rows = []
+    with ProcessPoolExecutor() as executor:
+        futures = [
+            executor.submit(_grid_worker, symbol, min_drop, df)
+            for symbol, df in klines.items()
+            for min_drop in min_drops
+        ]
+        for future in as_completed(futures):
+            rows.append(future.result())
+
+    summary = pd.DataFrame(rows, columns=['symbol', 'min_drop', 'drops', 'recovery_rate', 'avg_gain'])
+    summary = summary.sort_values(['symbol', 'min_drop']).reset_index(drop=True)
 
-    return df, df_results
+    print(format_grid_summary(summary), end="")
+    return summary
 
 
 def main():
@@ -136,14 +220,10 @@ def main():
     # Try with configured threshold
     df, results = run_backtest(days=180)
 
-    # If no results, try with 3%
+    # If no results, try with 3% on the data already downloaded
     if results is None and df is not None:
         print("\n🔄 Trying again with 3% threshold...\n")
-        drops = find_drops_advanced(df, min_drop=3.0)
-        if len(drops) > 0:
-            results_list = analyze_recovery(df, drops)
-            print_statistics(results_list)
-            print_recent_opportunities(results_list)
+        run_backtest(days=180, min_drop=3.0, df=df)
 
     if df is not None:
         print(format_completion_message())
@@ -0,0 +1,165 @@
+"""
+Numba-compiled numeric kernels for the indicators
+
+Falls back to plain Python when numba is not installed.
+"""
+
+import numpy as np
+
+try:
+    from numba import njit
+except ImportError:  # pragma: no cover - numba is optional
+    def njit(*args, **kwargs):
+        """No-op stand-in for numba.njit"""
+        if len(args) == 1 and callable(args[0]) and not kwargs:
+            return args[0]
+        return lambda func: func
+
+
+@njit(cache=True)
+def sma_tail(close: np.ndarray, period: int) -> float:
+    """
+    Simple moving average of the last `period` closes
+
+    Args:
+        close: Close prices (float64)
+        period: SMA period
+
+    Returns:
+        Mean of the trailing window; NaN when there are fewer than `period` closes
+    """
+    n = close.shape[0]
+    if period < 1 or n < period:
+        return np.nan
+
+    total = 0.0
+    for i in range(n - period, n):
+        total += close[i]
+    return total / period
+
+
+@njit(cache=True)
+def _wilder_alpha(period: int) -> float:
+    """Smoothing factor 1/period, round-tripped through pandas' center-of-mass form"""
+    alpha = 1.0 / period
+    com = (1.0 - alpha) / alpha
+    return 1.0 / (1.0 + com)
+
+
+@njit(cache=True)
+def _rma_step(prev: float, value: float, alpha: float) -> float:
+    """
+    One Wilder (RMA) smoothing step
+
+    Mirrors pandas ewm(alpha=alpha, adjust=False) step by step (including its
+    constant-series shortcut), which is the RMA used by pandas_ta 0.4.x. The
+    pandas_ta 0.3.x RMA (adjust=True, min_periods=length) gives different values.
+    """
+    if prev != prev:  # NaN: first observation seeds the average
+        return value
+    if prev == value:
+        return prev
+    old_wt = 1.0 - alpha
+    return (old_wt * prev + alpha * value) / (old_wt + alpha)
+
+
+@njit(cache=True)
+def rsi_wilder_seed(close: np.ndarray, period: int):
+    """
+    Wilder average gain/loss over a close series
+
+    Args:
+        close: Close prices (float64)
+        period: RSI period
+
+    Returns:
+        Tuple of (avg_gain, avg_loss); NaN when there are fewer than 2 closes
+    """
+    alpha = _wilder_alpha(period)
+    avg_gain = np.nan
+    avg_loss = np.nan
+
+    for i in range(1, close.shape[0]):
+        delta = close[i] - close[i - 1]
+        avg_gain = _rma_step(avg_gain, delta if delta > 0.0 else 0.0, alpha)
+        avg_loss = _rma_step(avg_loss, -delta if delta < 0.0 else 0.0, alpha)
+
+    return avg_gain, avg_loss
+
+
+@njit(cache=True)
+def rsi_wilder_update(avg_gain: float, avg_loss: float, delta: float, period: int):
+    """
+    Advance Wilder averages by one close-to-close change
+
+    Args:
+        avg_gain: Previous average gain (NaN if none yet)
+        avg_loss: Previous average loss (NaN if none yet)
+        delta: Latest close minus previous close
+        period: RSI period
+
+    Returns:
+        Tuple of (avg_gain, avg_loss, rsi)
+    """
+    alpha = _wilder_alpha(period)
+    avg_gain = _rma_step(avg_gain, delta if delta > 0.0 else 0.0, alpha)
+    avg_loss = _rma_step(avg_loss, -delta if delta < 0.0 else 0.0, alpha)
+
+    total = avg_gain + avg_loss
+    rsi = 100.0 * avg_gain / total if total != 0.0 else np.nan
+    return avg_gain, avg_loss, rsi
+
+
+@njit(cache=True, error_model='numpy')
+def strongest_drops(close: np.ndarray, high: np.ndarray, low: np.ndarray, window: int):
+    """
+    Per-day strongest drop among the three detection methods, in one pass
+
+    Methods (codes): 0 close-to-close, 1 drawdown from the rolling `window`-day
+    high, 2 intraday high-to-low. The rolling high is kept with a monotonic
+    deque, so the whole scan is O(N). Ties go to the lowest code.
+
+    Args:
+        close: Close prices (float64)
+        high: High prices (float64)
+        low: Low prices (float64)
+        window: Rolling high window in bars
+
+    Returns:
+        Tuple of (method codes as int8, drop percentages) per day
+    """
+    n = close.shape[0]
+    codes = np.zeros(n, dtype=np.int8)
+    best = np.full(n, np.inf)
+
+    # Indices of a decreasing run of highs; the front is the window max
+    deque = np.empty(n, dtype=np.int64)
+    head = 0
+    tail = 0
+
+    for i in range(n):
+        while tail > head and high[deque[tail - 1]] <= high[i]:
+            tail -= 1
+        deque[tail] = i
+        tail += 1
+        if deque[head] <= i - window:
+            head += 1
+        rolling_max = high[deque[head]]
+
+        if i > 0:
+            change = (close[i] / close[i - 1] - 1) * 100
+            if change < best[i]:
+                best[i] = change
+                codes[i] = 0
+
+        change = ((low[i] - rolling_max) / rolling_max) * 100
+        if change < best[i]:
+            best[i] = change
+            codes[i] = 1
+
+        change = ((low[i] - high[i]) / high[i]) * 100
+        if change < best[i]:
+            best[i] = change
+            codes[i] = 2
+
+    return codes, best
@@ -2,42 +2,133 @@
 Binance API client - reusable wrapper for API calls
 """
 
+import os
+import orjson
 import requests
+from requests.adapters import HTTPAdapter, DEFAULT_POOLSIZE
+from urllib3.util.retry import Retry
+import numpy as np
 import pandas as pd
-from datetime import datetime, timedelta
+from concurrent.futures import ThreadPoolExecutor
 from typing import Dict, Optional
 import time
 
+KLINES_LIMIT = 1000  # Max candles Binance returns per klines request
+DAY_MS = 86_400_000
+
+
+def _klines_to_dataframe(data: list) -> pd.DataFrame:
+    """
+    Convert raw Binance klines rows into a typed OHLCV DataFrame
+
+    Only the first six fields (open time + OHLCV) are used, converted to
+    float64 in a single pass instead of one astype per column.
+    """
+    values = np.array([row[:6] for row in data], dtype=np.float64).reshape(-1, 6)
+    return pd.DataFrame({
+        'timestamp': pd.to_datetime(values[:, 0].astype(np.int64), unit='ms'),
+        'open': values[:, 1],
+        'high': values[:, 2],
+        'low': values[:, 3],
+        'close': values[:, 4],
+        'volume': values[:, 5]
+    })
+
+
+def create_session(retries: int = 3, pool_maxsize: int = 4) -> requests.Session:
+    """
+    Build a pooled HTTP session with retry/backoff, shareable across clients
+
+    Args:
+        retries: Retries per request on connection errors, 429 and 5xx
+        pool_maxsize: Max concurrent keep-alive connections per host
+
+    Returns:
+        Configured requests.Session
+    """
+    # Reuse TCP/TLS connections across calls (requests negotiates gzip by default).
+    # urllib3 retries with exponential backoff, waiting Retry-After on 429 instead.
+    # 418 (IP ban) is deliberately not retried: its Retry-After can be hours long
+    retry = Retry(
+        total=retries,
+        backoff_factor=1,
+        status_forcelist=[429, 500, 502, 503, 504],
+        allowed_methods=['GET'],
+        respect_retry_after_header=True,
+        raise_on_status=False
+    )
+    adapter = HTTPAdapter(pool_connections=1, pool_maxsize=pool_maxsize, max_retries=retry)
+    session = requests.Session()
+    session.mount('https://', adapter)
+    session.mount('http://', adapter)
+    return session
+
 
 class BinanceClient:
     """Simple Binance API client"""
 
-    def __init__(self, symbol: str = 'BTCUSDT', base_url: str = "https://api.binance.us"):
+    def __init__(self, symbol: str = 'BTCUSDT', base_url: str = "https://api.binance.us",
+                 cache_dir: Optional[str] = None, cache_ttl: int = 3600, retries: int = 3,
+                 session: Optional[requests.Session] = None):
+        """
+        Initialize client
+
+        Args:
+            symbol: Trading symbol (e.g., BTCUSDT)
+            base_url: Binance API base URL
+            cache_dir: Directory for cached klines (disabled when None)
+            cache_ttl: Seconds before a cached klines file is refetched
+            retries: Retries per request on connection errors, 429 and 5xx
+            session: Shared session from create_session (a private one is built when None)
+        """
         self.symbol = symbol
         self.base_url = base_url
+        self.cache_dir = cache_dir
+        self.cache_ttl = cache_ttl
+        self.session = session if session is not None else create_session(retries)
+
+    def _cache_path(self, interval: str, days: int) -> str:
+        """Path of the cached klines file for this symbol/interval/window"""
+        return os.path.join(self.cache_dir, f"klines_{self.symbol}_{interval}_{days}.pkl")
+
+    def _load_cached_klines(self, interval: str, days: int,
+                            max_age: Optional[float] = None) -> Optional[pd.DataFrame]:
+        """Return cached klines if present and younger than max_age (defaults to the TTL)"""
+        if not self.cache_dir:
+            return None
+
+        if max_age is None:
+            max_age = self.cache_ttl
 
-    def get_current_price(self) -> Optional[float]:
-        """Get current price for symbol"""
+        path = self._cache_path(interval, days)
         try:
-            url = f"{self.base_url}/api/v3/ticker/price"
-            params = {'symbol': self.symbol}
-            response = requests.get(url, params=params, timeout=10)
-            response.raise_for_status()
-            data = response.json()
-            return float(data['price'])
-        except Exception as e:
-            print(f"❌ Error fetching price: {e}")
+            if time.time() - os.path.getmtime(path) > max_age:
+                return None
+            return pd.read_pickle(path)
+        except Exception:
             return None
 
+    def _save_cached_klines(self, interval: str, days: int, df: pd.DataFrame):
+        """Persist klines to the cache directory"""
+        if not self.cache_dir:
+            return
+
+        try:
+            os.makedirs(self.cache_dir, exist_ok=True)
+            df.to_pickle(self._cache_path(interval, days))
+        except Exception as e:
+            print(f"⚠️ Error writing klines cache: {e}")
+
     def get_24h_stats(self) -> Optional[Dict]:
-        """Get 24h statistics"""
+        """Get 24h statistics (including the last price, so no separate price call is needed)"""
         try:
             url = f"{self.base_url}/api/v3/ticker/24hr"
             params = {'symbol': self.symbol}
-            response = requests.get(url, params=params, timeout=10)
+            response = self.session.get(url, params=params, timeout=10)
             response.raise_for_status()
-            data = response.json()
+            data = orjson.loads(response.content)
             return {
+                'price': float(data['lastPrice']),
                 'price_change': float(data['priceChange']),
                 'price_change_percent': float(data['priceChangePercent']),
                 'high': float(data['highPrice']),
@@ -52,8 +143,8 @@ class BinanceClient:
         """Get historical candlestick data"""
         try:
             url = f"{self.base_url}/api/v3/klines"
-            end_time = int(datetime.now().timestamp() * 1000)
-            start_time = int((datetime.now() - timedelta(days=days)).timestamp() * 1000)
+            end_time = time.time_ns() // 1_000_000
+            start_time = end_time - days * 86_400_000
 
             params = {
                 'symbol': self.symbol,
@@ -63,73 +154,117 @@ class BinanceClient:
                 'limit': 1000
             }
 
-            response = requests.get(url, params=params, timeout=10)
+            response = self.session.get(url, params=params, timeout=10)
             response.raise_for_status()
-            data = response.json()
+            data = orjson.loads(response.content)
 
-            # Convert to DataFrame
-            df = pd.DataFrame(data, columns=[
-                'timestamp', 'open', 'high', 'low', 'close', 'volume',
-                'close_time', 'quote_volume', 'trades', 'taker_buy_base',
-                'taker_buy_quote', 'ignore'
-            ])
+            return _klines_to_dataframe(data)
 
-            # Convert types
-            df['timestamp'] = pd.to_datetime(df['timestamp'], unit='ms')
-            for col in ['open', 'high', 'low', 'close', 'volume']:
-                df[col] = df[col].astype(float)
+        except Exception as e:
+            print(f"❌ Error fetching historical data: {e}")
+            return None
 
-            return df[['timestamp', 'open', 'high', 'low', 'close', 'volume']]
+    def get_latest_kline(self) -> Optional[pd.DataFrame]:
+        """Get the current (still forming) daily candle as a one-row DataFrame"""
+        try:
+            url = f"{self.base_url}/api/v3/klines"
+            params = {
+                'symbol': self.symbol,
+                'interval': '1d',
+                'limit': 1
+            }
+
+            response = self.session.get(url, params=params, timeout=10)
+            response.raise_for_status()
+            data = orjson.loads(response.content)
+
+            return _klines_to_dataframe(data)
 
         except Exception as e:
-            print(f"❌ Error fetching historical data: {e}")
+            print(f"❌ Error fetching latest kline: {e}")
             return None
 
-    def get_historical_with_retry(self, days: int = 180, retries: int = 3) -> Optional[pd.DataFrame]:
-        """Fetch historical data with retry logic (for backtest)"""
+    def _get_klines_chunk(self, start_time: int, end_time: int, headers: Optional[Dict] = None) -> list:
+        """Fetch one klines request (at most KLINES_LIMIT daily candles)"""
+        params = {
+            'symbol': self.symbol,
+            'interval': '1d',
+            'startTime': start_time,
+            'endTime': end_time,
+            'limit': KLINES_LIMIT
+        }
+
+        response = self.session.get(f"{self.base_url}/api/v3/klines", params=params,
+                                    headers=headers, timeout=15)
+        response.raise_for_status()
+        return orjson.loads(response.content)
+
+    def _get_klines_range(self, start_time: int, end_time: int, headers: Optional[Dict] = None) -> list:
+        """
+        Fetch daily klines for [start_time, end_time] (ms)
+
+        Windows longer than KLINES_LIMIT days are split into per-request chunks
+        fetched concurrently (bounded to the session's pool size) and merged in
+        chronological order.
+        """
+        chunk_ms = KLINES_LIMIT * DAY_MS
+        bounds = [(start, min(start + chunk_ms - 1, end_time))
+                  for start in range(start_time, end_time + 1, chunk_ms)]
+
+        if len(bounds) == 1:
+            return self._get_klines_chunk(*bounds[0], headers)
+
+        # Never run more requests at once than the session keeps connections for
+        adapter = self.session.get_adapter(self.base_url)
+        max_workers = min(len(bounds), getattr(adapter, '_pool_maxsize', DEFAULT_POOLSIZE))
+
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            chunks = executor.map(lambda b: self._get_klines_chunk(b[0], b[1], headers), bounds)
+            return [row for chunk in chunks for row in chunk]
+
+    def get_historical_with_retry(self, days: int = 180) -> Optional[pd.DataFrame]:
+        """Fetch historical data for backtest (retries/backoff handled by the session adapter)"""
+        cached = self._load_cached_klines('1d', days)
+        if cached is not None:
+            return cached
+
+        # An expired cache still holds most of the window: only fetch from its
+        # last candle on (refetched, since it may have been partial when saved)
+        stale = self._load_cached_klines('1d', days, max_age=float('inf'))
+        if stale is not None and len(stale) == 0:
+            stale = None
+
         headers = {
             'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
         }
 
-        for attempt in range(retries):
-            try:
-                url = f"{self.base_url}/api/v3/klines"
-                end_time = int(datetime.now().timestamp() * 1000)
-                start_time = int((datetime.now() - timedelta(days=days)).timestamp() * 1000)
-
-                params = {
-                    'symbol': self.symbol,
-                    'interval': '1d',
-                    'startTime': start_time,
-                    'endTime': end_time,
-                    'limit': 1000
-                }
-
-                response = requests.get(url, params=params, headers=headers, timeout=15)
-
-                if response.status_code == 200:
-                    data = response.json()
-                    if len(data) == 0:
-                        return None
-
-                    df = pd.DataFrame(data, columns=[
-                        'timestamp', 'open', 'high', 'low', 'close', 'volume',
-                        'close_time', 'quote_volume', 'trades', 'taker_buy_base',
-                        'taker_buy_quote', 'ignore'
-                    ])
-
-                    df['timestamp'] = pd.to_datetime(df['timestamp'], unit='ms')
-                    df['date'] = df['timestamp'].dt.date
-                    for col in ['open', 'high', 'low', 'close', 'volume']:
-                        df[col] = df[col].astype(float)
-
-                    return df[['date', 'timestamp', 'open', 'high', 'low', 'close', 'volume']]
-                else:
-                    if attempt < retries - 1:
-                        time.sleep(2 ** attempt)  # Exponential backoff
-
-            except Exception:
-                if attempt < retries - 1:
-                    time.sleep(2 ** attempt)
-
-        return None
+        end_time = time.time_ns() // 1_000_000
+        start_time = end_time - days * DAY_MS
+        window_start = pd.to_datetime(start_time, unit='ms')
+
+        try:
+            fetch_start = start_time
+            if stale is not None:
+                last_cached = stale['timestamp'].iloc[-1].value // 1_000_000  # ns -> ms
+                fetch_start = max(start_time, last_cached)
+
+            data = self._get_klines_range(fetch_start, end_time, headers)
+            if len(data) == 0 and stale is None:
+                return None
+
+            df = _klines_to_dataframe(data)
+            if stale is not None:
+                # Merge the delta over the cache and trim to the requested window
+                df = pd.concat([stale, df]).drop_duplicates('timestamp', keep='last')
+                df = df[df['timestamp'] >= window_start].reset_index(drop=True)
+
+            self._save_cached_klines('1d', days, df)
+            return df
+
+        except Exception as e:
+            print(f"❌ Error fetching historical data: {e}")
+            if stale is None:
+                return None
+            # Fall back to the expired cache rather than reporting no data
+            print("⚠️ Using expired klines cache")
+            return stale[stale['timestamp'] >= window_start].reset_index(drop=True)
@@ -3,66 +3,146 @@ Technical indicators and analysis functions
 RSI, Moving Average, Support/Resistance detection
 """
 
+import time
 import pandas as pd
-import pandas_ta as ta
 import numpy as np
-from typing import Tuple, List
+from functools import lru_cache
+from typing import Tuple, List, NamedTuple
+from btc_monitor._kernels import sma_tail, rsi_wilder_seed, rsi_wilder_update, strongest_drops
 
 
-def calculate_rsi(prices: pd.Series, period: int = 14) -> float:
-    """Calculate RSI (Relative Strength Index) using pandas_ta"""
-    rsi = ta.rsi(prices, length=period)
-    return rsi.iloc[-1]
+def calculate_rsi(close: np.ndarray, period: int = 14) -> float:
+    """
+    Calculate RSI (Relative Strength Index) of the last price
+
+    Wilder smoothing seeded with the first change (ewm adjust=False), the
+    same values as pandas_ta 0.4.x rsi. pandas_ta 0.3.x used adjusted
+    weights with min_periods, so RSI differs from it, most on short
+    histories. The averages over all completed bars are cached, so each
+    tick on the same history is a single O(1) update with the live last bar.
+    """
+    close = np.asarray(close, dtype=np.float64)
+    if len(close) < period + 1:
+        return np.nan
+
+    avg_gain, avg_loss = _rsi_seed(close[:-1].tobytes(), period)
+    _, _, rsi = rsi_wilder_update(avg_gain, avg_loss, close[-1] - close[-2], period)
+    return rsi
+
 
+@lru_cache(maxsize=32)
+def _rsi_seed(close_bytes: bytes, period: int) -> Tuple[float, float]:
+    """Memoized Wilder averages over the completed bars (keyed by their raw bytes)"""
+    return rsi_wilder_seed(np.frombuffer(close_bytes, dtype=np.float64), period)
 
-def calculate_moving_average(df: pd.DataFrame, period: int) -> float:
-    """Calculate simple moving average using pandas_ta"""
-    sma = ta.sma(df['close'], length=period)
-    return sma.iloc[-1]
 
+def calculate_moving_average(close: np.ndarray, period: int) -> float:
+    """Calculate simple moving average of the last price (NaN with fewer than `period` bars)"""
+    return sma_tail(np.asarray(close, dtype=np.float64), period)
 
-def calculate_support_resistance(df: pd.DataFrame, tolerance: float = 0.02) -> Tuple[List[float], List[float]]:
+
+def calculate_support_resistance(high: np.ndarray, low: np.ndarray,
+                                 tolerance: float = 0.02) -> Tuple[List[float], List[float]]:
     """
     Identify support and resistance levels based on price touches
 
     Args:
-        df: DataFrame with OHLC data
+        high: High prices
+        low: Low prices
         tolerance: Percentage tolerance to group nearby levels (default 2%)
 
     Returns:
         Tuple of (supports, resistances) as lists
     """
-    highs = df['high'].values
-    lows = df['low'].values
+    highs = np.ascontiguousarray(high, dtype=np.float64)
+    lows = np.ascontiguousarray(low, dtype=np.float64)
+
+    # Keyed by the raw price bytes so reruns on unchanged data hit the cache
+    supports, resistances = _support_resistance_levels(highs.tobytes(), lows.tobytes(), tolerance)
+    return list(supports), list(resistances)
+
+
+@lru_cache(maxsize=8)
+def _support_resistance_levels(high_bytes: bytes, low_bytes: bytes,
+                               tolerance: float) -> Tuple[Tuple[float, ...], Tuple[float, ...]]:
+    """Memoized core of calculate_support_resistance (tuples keep cached results immutable)"""
+    highs = np.frombuffer(high_bytes, dtype=np.float64)
+    lows = np.frombuffer(low_bytes, dtype=np.float64)
 
     def cluster_levels(levels, tolerance):
-        """Group nearby price levels"""
+        """Group nearby price levels (a new cluster starts where the gap to the previous level exceeds tolerance)"""
         if len(levels) == 0:
             return []
 
-        levels = sorted(levels)
-        clusters = []
-        current_cluster = [levels[0]]
+        levels = np.sort(levels)
+        gaps = np.diff(levels) / levels[:-1]
+        starts = np.r_[0, np.flatnonzero(gaps > tolerance) + 1]
+        counts = np.diff(np.r_[starts, levels.size])
+        return (np.add.reduceat(levels, starts) / counts).tolist()
+
+    # Cluster high and low levels
+    all_highs = cluster_levels(highs, tolerance)
+    all_lows = cluster_levels(lows, tolerance)
 
-        for level in levels[1:]:
-            if abs(level - current_cluster[-1]) / current_cluster[-1] <= tolerance:
-                current_cluster.append(level)
-            else:
-                clusters.append(np.mean(current_cluster))
-                current_cluster = [level]
+    # Get top 5 resistance and support levels. Clusters are contiguous runs of
+    # sorted prices, so their means are already ascending: no sort needed
+    resistances = all_highs[::-1][:5]
+    supports = all_lows[::-1][:5]
 
-        clusters.append(np.mean(current_cluster))
-        return clusters
+    return tuple(supports), tuple(resistances)
+
+
+DROP_TYPES = np.array(['Close-to-Close', 'Peak-to-Valley', 'Intraday'])
+
+
+class DropSignals(NamedTuple):
+    """Detected drops as a struct of arrays (one entry per drop day)"""
+    idx: np.ndarray           # Row positions in the source OHLC arrays
+    tipo_code: np.ndarray     # Index into DROP_TYPES of the strongest method
+    drop_percent: np.ndarray  # Drop magnitude of that method (negative %)
 
-    # Cluster high and low levels
-    all_highs = cluster_levels(highs.tolist(), tolerance)
-    all_lows = cluster_levels(lows.tolist(), tolerance)
 
-    # Get top 5 resistance and support levels
-    resistances = sorted(all_highs, reverse=True)[:5]
-    supports = sorted(all_lows, reverse=True)[:5]
+def compute_drop_signals(close: np.ndarray, high: np.ndarray, low: np.ndarray,
+                         min_drop: float = 5.0) -> DropSignals:
+    """
+    Detect price drops on raw OHLC arrays, keeping the strongest method per day
+
+    Args:
+        close: Close prices
+        high: High prices
+        low: Low prices
+        min_drop: Minimum drop percentage to detect
+
+    Returns:
+        DropSignals with the positions, method codes and magnitudes of the drops
+    """
+    close = np.ascontiguousarray(close, dtype=np.float64)
+    high = np.ascontiguousarray(high, dtype=np.float64)
+    low = np.ascontiguousarray(low, dtype=np.float64)
+
+    # The per-day metrics do not depend on min_drop: reruns on the same data
+    # (e.g. the backtest's 3% fallback) only redo the threshold mask
+    strongest, best_change = _strongest_drop_metrics(close.tobytes(), high.tobytes(), low.tobytes())
+
+    idx = np.flatnonzero(best_change <= -min_drop)
+    return DropSignals(idx=idx, tipo_code=strongest[idx], drop_percent=best_change[idx])
 
-    return supports, resistances
+
+@lru_cache(maxsize=8)
+def _strongest_drop_metrics(close_bytes: bytes, high_bytes: bytes,
+                            low_bytes: bytes) -> Tuple[np.ndarray, np.ndarray]:
+    """Memoized per-day (strongest method code, drop %) arrays (read-only, shared by the cache)"""
+    close = np.frombuffer(close_bytes, dtype=np.float64)
+    high = np.frombuffer(high_bytes, dtype=np.float64)
+    low = np.frombuffer(low_bytes, dtype=np.float64)
+
+    # Close-to-close, drawdown from the 30-day high and intraday drop, with the
+    # strongest method per day, computed in a single compiled pass
+    strongest, best_change = strongest_drops(close, high, low, 30)
+
+    strongest.setflags(write=False)
+    best_change.setflags(write=False)
+    return strongest, best_change
 
 
 def find_drops_advanced(df: pd.DataFrame, min_drop: float = 5.0) -> pd.DataFrame:
@@ -79,29 +159,13 @@ def find_drops_advanced(df: pd.DataFrame, min_drop: float = 5.0) -> pd.DataFrame
     Returns:
         DataFrame with detected drops
     """
-    # Method 1: Close to close
-    df['change_close'] = df['close'].pct_change() * 100
-    drops_close = df[df['change_close'] <= -min_drop].copy()
-    drops_close['tipo'] = 'Close-to-Close'
-
-    # Method 2: Drawdown from peak
-    df['rolling_max'] = df['high'].rolling(window=30, min_periods=1).max()
-    df['drawdown'] = ((df['low'] - df['rolling_max']) / df['rolling_max']) * 100
-    drops_drawdown = df[df['drawdown'] <= -min_drop].copy()
-    drops_drawdown['tipo'] = 'Peak-to-Valley'
-    drops_drawdown['change_close'] = drops_drawdown['drawdown']
-
-    # Method 3: Intraday
-    df['change_intraday'] = ((df['low'] - df['high']) / df['high']) * 100
-    drops_intraday = df[df['change_intraday'] <= -min_drop].copy()
-    drops_intraday['tipo'] = 'Intraday'
-    drops_intraday['change_close'] = drops_intraday['change_intraday']
-
-    # Combine and remove duplicates by date
-    all_drops = pd.concat([drops_close, drops_drawdown, drops_intraday])
-
-    if len(all_drops) > 0:
-        all_drops = all_drops.sort_values('change_close').groupby('date').first().reset_index()
+    # Detection runs on plain arrays; the input df is not modified
+    signals = compute_drop_signals(df['close'].to_numpy(), df['high'].to_numpy(),
+                                   df['low'].to_numpy(), min_drop)
+
+    all_drops = df.iloc[signals.idx].reset_index(drop=True)
+    all_drops['change_close'] = signals.drop_percent
+    all_drops['tipo'] = DROP_TYPES[signals.tipo_code]
 
     return all_drops
 
@@ -117,7 +181,7 @@ def analyze_opportunity(current_price: float, stats_24h: dict, df_historical: pd
         Dictionary with analysis results and signals
     """
     analysis = {
-        'timestamp': pd.Timestamp.now().strftime('%Y-%m-%d %H:%M:%S'),
+        'timestamp': time.strftime('%Y-%m-%d %H:%M:%S'),
         'price': current_price,
         'signals': [],
         'entry_signal': False,
@@ -128,47 +192,57 @@ def analyze_opportunity(current_price: float, stats_24h: dict, df_historical: pd
 
     # 1. Check 24h drop
     drop_24h = stats_24h['price_change_percent']
-    if drop_24h <= -min_drop:
+    is_drop = drop_24h <= -min_drop
+    if is_drop:
         analysis['signals'].append(f"🔴 24H DROP: {drop_24h:.2f}% (minimum: {-min_drop}%)")
-        analysis['score'] += 3
+
+    # Pull the price columns out of the frame once; the indicators work on arrays
+    close, high, low = np.ascontiguousarray(
+        df_historical[['close', 'high', 'low']].to_numpy(dtype=np.float64).T)
 
     # 2. Check moving average
-    ma = calculate_moving_average(df_historical, ma_period)
+    ma = calculate_moving_average(close, ma_period)
     ma_dist = ((current_price - ma) / ma) * 100
     analysis['ma'] = ma
     analysis['ma_distance'] = ma_dist
 
-    if ma_dist <= -ma_distance:
+    is_below_ma = ma_dist <= -ma_distance
+    if is_below_ma:
         analysis['signals'].append(f"🔴 BELOW MA{ma_period}: {ma_dist:.2f}% (minimum: {-ma_distance}%)")
-        analysis['score'] += 2
 
     # 3. Check RSI
-    rsi = calculate_rsi(df_historical['close'])
+    rsi = calculate_rsi(close)
     analysis['rsi'] = rsi
 
-    if rsi < rsi_oversold:
+    is_oversold = rsi < rsi_oversold
+    if is_oversold:
         analysis['signals'].append(f"🔴 RSI OVERSOLD: {rsi:.1f} (limit: {rsi_oversold})")
-        analysis['score'] += 2
 
     # 4. Support and Resistance levels
-    supports, resistances = calculate_support_resistance(df_historical)
+    supports, resistances = calculate_support_resistance(high, low)
     analysis['supports'] = supports
     analysis['resistances'] = resistances
 
-    # Check if near support
-    for support in supports:
-        diff_support = ((current_price - support) / support) * 100
-        if -2 <= diff_support <= 2:  # Within 2% of support
-            analysis['signals'].append(f"🟡 NEAR SUPPORT: USD {support:,.2f}")
-            analysis['score'] += 1
-            break
+    # Check if near support (within 2%; the first match in list order is reported)
+    supports_arr = np.asarray(supports, dtype=np.float64)
+    near = np.abs(((current_price - supports_arr) / supports_arr) * 100) <= 2
+    is_near_support = bool(near.any())
+    if is_near_support:
+        analysis['signals'].append(f"🟡 NEAR SUPPORT: USD {supports[int(near.argmax())]:,.2f}")
+
+    # Weighted sum of the triggered conditions
+    analysis['score'] = 3 * bool(is_drop) + 2 * bool(is_below_ma) + 2 * bool(is_oversold) + is_near_support
+
+    # Levels come back descending; binary-search the ascending views for the
+    # nearest resistance above and support below the current price
+    resistances_asc = np.asarray(resistances[::-1], dtype=np.float64)
+    supports_asc = np.asarray(supports[::-1], dtype=np.float64)
 
     # 5. Calculate target price (hybrid approach: partial resistance + cap)
     target_resistance = None
-    for resistance in sorted(resistances):
-        if resistance > current_price:
-            target_resistance = resistance
-            break
+    above = np.searchsorted(resistances_asc, current_price, side='right')
+    if above < len(resistances_asc):
+        target_resistance = resistances[::-1][above]
 
     if target_resistance:
         # Calculate distance to resistance
@@ -196,10 +270,9 @@ def analyze_opportunity(current_price: float, stats_24h: dict, df_historical: pd
 
     # 6. Calculate stop loss (next support or fixed %)
     stop_support = None
-    for support in sorted(supports, reverse=True):
-        if support < current_price:
-            stop_support = support
-            break
+    below = np.searchsorted(supports_asc, current_price, side='left') - 1
+    if below >= 0:
+        stop_support = supports[::-1][below]
 
     if stop_support:
         stop_percent = ((current_price - stop_support) / current_price) * 100
@@ -211,6 +284,10 @@ def analyze_opportunity(current_price: float, stats_24h: dict, df_historical: pd
         analysis['stop_loss'] = current_price * (1 - stop_loss / 100)
         analysis['stop_percent'] = stop_loss
 
+    # Derived once here so every renderer reuses it (None with a zero stop distance)
+    analysis['risk_reward'] = (analysis['profit_percent'] / analysis['stop_percent']
+                               if analysis['stop_percent'] else None)
+
     # Entry signal if score >= 3
     if analysis['score'] >= 3:
         analysis['entry_signal'] = True
@@ -10,20 +10,31 @@ from dotenv import load_dotenv
 load_dotenv()
 
 
+def _to_bool(value: str) -> bool:
+    """Parse common truthy strings (true/1/yes/on)"""
+    return value.lower() in ('true', '1', 'yes', 'on')
+
+
+# Type conversions for get_env (other types return the raw string)
+_CONVERTERS = {
+    bool: _to_bool,
+    float: float,
+    int: int,
+}
+
+
 def get_env(key: str, default=None, value_type=str):
     """Get environment variable with type conversion"""
     value = os.getenv(key)
     if value is None:
         return default
 
-    try:
-        if value_type == bool:
-            return value.lower() in ('true', '1', 'yes', 'on')
-        elif value_type == float:
-            return float(value)
-        elif value_type == int:
-            return int(value)
+    converter = _CONVERTERS.get(value_type)
+    if converter is None:
         return value
+
+    try:
+        return converter(value)
     except (ValueError, AttributeError):
         return default
 
@@ -51,6 +62,11 @@ RESISTANCE_FACTOR = get_env('RESISTANCE_FACTOR', 0.6, float)  # Partial distance
 # === MONITORING ===
 CHECK_INTERVAL = get_env('CHECK_INTERVAL', 300, int)
 HISTORICAL_DAYS = get_env('HISTORICAL_DAYS', 90, int)
+VERBOSE = get_env('VERBOSE', True, bool)  # Full analysis every tick (False: one line unless a signal fires)
+
+# === CACHE ===
+CACHE_DIR = get_env('CACHE_DIR', '.cache')  # Backtest klines cache directory
+CACHE_TTL = get_env('CACHE_TTL', 3600, int)  # Seconds before cached klines are refetched
 
 # === TELEGRAM NOTIFICATION ===
 TELEGRAM_ENABLED = get_env('TELEGRAM_ENABLED', False, bool)
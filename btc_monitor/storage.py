@@ -1,14 +1,18 @@
 """
-Signal storage - JSON file persistence
+Signal storage - append-only JSON Lines persistence
 """
 
-import json
 import os
-from typing import List, Dict
+import orjson
+from collections import deque
+from typing import List, Dict, Optional, Deque
+
+TAIL_SIZE = 100          # Recent signals kept in memory for get_latest
+TAIL_BLOCK = 64 * 1024   # Bytes read per step when scanning the log backwards
 
 
 class SignalStorage:
-    """Simple JSON storage for trading signals"""
+    """Append-only JSONL storage for trading signals"""
 
     def __init__(self, symbol: str = None, filepath: str = None):
         """
@@ -16,18 +20,58 @@ class SignalStorage:
 
         Args:
             symbol: Trading symbol (e.g., BTCUSDT) - will create symbol-specific file
-            filepath: Path to JSON log file (overrides symbol-based naming)
+            filepath: Path to JSONL log file (overrides symbol-based naming)
         """
         if filepath:
             self.filepath = filepath
         elif symbol:
-            self.filepath = f'signals_{symbol}.json'
+            self.filepath = f'signals_{symbol}.jsonl'
         else:
-            self.filepath = 'signals_log.json'
+            self.filepath = 'signals_log.jsonl'
+
+        # In-memory copy of the log, loaded on first read and kept in sync on save
+        self._cache: Optional[List[Dict]] = None
+
+        # Ring buffer of the newest signals, read from the end of the log on first use
+        self._tail: Optional[Deque[Dict]] = None
+
+        self._migrate_legacy()
+
+    @staticmethod
+    def _encode(signal: Dict) -> bytes:
+        """Serialize one signal as a compact JSON line (numpy values included, NaN as null)"""
+        return orjson.dumps(signal, default=str,
+                            option=orjson.OPT_APPEND_NEWLINE | orjson.OPT_SERIALIZE_NUMPY)
+
+    def _migrate_legacy(self):
+        """Convert a legacy JSON-array log (signals_*.json) to JSONL once"""
+        source = None
+        if os.path.exists(self.filepath):
+            with open(self.filepath, 'rb') as f:
+                if f.read(64).lstrip().startswith(b'['):
+                    source = self.filepath
+        elif self.filepath.endswith('.jsonl') and os.path.exists(self.filepath[:-1]):
+            source = self.filepath[:-1]
+
+        if source is None:
+            return
+
+        try:
+            with open(source, 'rb') as f:
+                logs = orjson.loads(f.read())
+
+            tmp_path = self.filepath + '.tmp'
+            with open(tmp_path, 'wb') as f:
+                f.writelines(self._encode(signal) for signal in logs)
+            os.replace(tmp_path, self.filepath)
+
+            print(f"💾 Migrated {len(logs)} signals from {source} to {self.filepath}")
+        except Exception as e:
+            print(f"⚠️ Error migrating legacy signals: {e}")
 
     def save_signal(self, signal: Dict) -> bool:
         """
-        Save a trading signal to log file
+        Save a trading signal to log file (appends a single line)
 
         Args:
             signal: Dictionary containing signal data
@@ -36,15 +80,20 @@ class SignalStorage:
             True if saved successfully, False otherwise
         """
         try:
-            # Load existing logs
-            logs = self.load_all()
-
-            # Add new signal
-            logs.append(signal)
-
-            # Save to file
-            with open(self.filepath, 'w') as f:
-                json.dump(logs, f, indent=2, default=str)
+            line = self._encode(signal)
+            with open(self.filepath, 'ab+') as f:
+                # Terminate a torn last line first so this record stays on its own line
+                if f.seek(0, os.SEEK_END) > 0:
+                    f.seek(-1, os.SEEK_END)
+                    if f.read(1) != b'\n':
+                        line = b'\n' + line
+                f.write(line)
+
+            stored = orjson.loads(line)
+            if self._cache is not None:
+                self._cache.append(stored)
+            if self._tail is not None:
+                self._tail.append(stored)
 
             print(f"💾 Signal saved to {self.filepath}")
             return True
@@ -60,16 +109,63 @@ class SignalStorage:
         Returns:
             List of signal dictionaries
         """
+        if self._cache is None:
+            self._cache = self._read_log()
+        return list(self._cache)
+
+    def _read_log(self) -> List[Dict]:
+        """Parse the JSONL log, skipping lines that fail to decode (e.g. a torn last write)"""
+        if not os.path.exists(self.filepath):
+            return []
+
+        logs = []
+        try:
+            with open(self.filepath, 'rb') as f:
+                for line in f:
+                    if not line.strip():
+                        continue
+                    try:
+                        logs.append(orjson.loads(line))
+                    except ValueError:
+                        print(f"⚠️ Skipping malformed signal line in {self.filepath}")
+        except Exception as e:
+            print(f"⚠️ Error loading signals: {e}")
+            return []
+
+        return logs
+
+    def _read_tail(self) -> List[Dict]:
+        """Parse only the last TAIL_SIZE signals, reading the log backwards in blocks"""
         if not os.path.exists(self.filepath):
             return []
 
         try:
-            with open(self.filepath, 'r') as f:
-                return json.load(f)
+            with open(self.filepath, 'rb') as f:
+                pos = f.seek(0, os.SEEK_END)
+                data = b''
+                while pos > 0 and data.count(b'\n') <= TAIL_SIZE:
+                    step = min(TAIL_BLOCK, pos)
+                    pos -= step
+                    f.seek(pos)
+                    data = f.read(step) + data
         except Exception as e:
             print(f"⚠️ Error loading signals: {e}")
             return []
 
+        lines = data.splitlines()
+        if pos > 0:
+            lines = lines[1:]  # First line may start mid-record
+
+        logs = []
+        for line in lines:
+            if not line.strip():
+                continue
+            try:
+                logs.append(orjson.loads(line))
+            except ValueError:
+                print(f"⚠️ Skipping malformed signal line in {self.filepath}")
+        return logs[-TAIL_SIZE:]
+
     def get_latest(self, n: int = 10) -> List[Dict]:
         """
         Get the latest N signals
@@ -80,5 +176,10 @@ class SignalStorage:
         Returns:
             List of latest signal dictionaries
         """
-        logs = self.load_all()
-        return logs[-n:] if logs else []
+        if self._cache is not None or n <= 0 or n > TAIL_SIZE:
+            logs = self.load_all()
+            return logs[-n:] if logs else []
+
+        if self._tail is None:
+            self._tail = deque(self._read_tail(), maxlen=TAIL_SIZE)
+        return list(self._tail)[-n:]
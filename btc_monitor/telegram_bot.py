@@ -2,10 +2,12 @@
 Telegram notification handler
 """
 
+import asyncio
 from telegram import Bot
 from telegram.error import TelegramError
+from telegram.request import HTTPXRequest
 from typing import Optional
-from btc_monitor.views.telegram import format_trade_signal, format_test_message
+from btc_monitor.views.telegram import format_test_message
 
 
 class TelegramNotifier:
@@ -21,17 +23,37 @@ class TelegramNotifier:
         """
         self.bot_token = bot_token
         self.chat_id = chat_id
-        self.bot: Optional[Bot] = None
 
-        if bot_token and chat_id:
-            try:
-                self.bot = Bot(token=bot_token)
-            except Exception as e:
-                print(f"⚠️ Failed to initialize Telegram bot: {e}")
+        # Created on first send, then reused with its pooled HTTP client
+        self.bot: Optional[Bot] = None
+        self._bot_lock = asyncio.Lock()
 
     def is_enabled(self) -> bool:
         """Check if Telegram is properly configured"""
-        return self.bot is not None
+        return bool(self.bot_token and self.chat_id)
+
+    async def _ensure_bot(self) -> Optional[Bot]:
+        """Create the Bot on first use (concurrent senders share one instance)"""
+        if self.bot is None:
+            async with self._bot_lock:
+                if self.bot is None:
+                    try:
+                        request = HTTPXRequest(connection_pool_size=4, pool_timeout=1.0)
+                        self.bot = Bot(token=self.bot_token, request=request)
+                    except Exception as e:
+                        print(f"⚠️ Failed to initialize Telegram bot: {e}")
+        return self.bot
+
+    async def connect(self) -> bool:
+        """
+        Create the Bot now rather than on the first send
+
+        Returns:
+            True if Telegram is configured and the Bot was created
+        """
+        if not self.is_enabled():
+            return False
+        return await self._ensure_bot() is not None
 
     async def send_message(self, message: str, parse_mode: str = 'Markdown') -> bool:
         """
@@ -44,11 +66,15 @@ class TelegramNotifier:
         Returns:
             True if sent successfully, False otherwise
         """
-        if not self.bot:
+        if not self.is_enabled():
+            return False
+
+        bot = await self._ensure_bot()
+        if bot is None:
             return False
 
         try:
-            await self.bot.send_message(
+            await bot.send_message(
                 chat_id=self.chat_id,
                 text=message,
                 parse_mode=parse_mode
@@ -61,21 +87,6 @@ class TelegramNotifier:
             print(f"❌ Unexpected error sending notification: {e}")
             return False
 
-    async def send_trade_signal(self, analysis: dict, symbol: str, ma_period: int) -> bool:
-        """
-        Send formatted trade signal notification
-
-        Args:
-            analysis: Analysis dictionary with signal data
-            symbol: Trading symbol (e.g., BTCUSDT)
-            ma_period: Moving average period used
-
-        Returns:
-            True if sent successfully
-        """
-        message = format_trade_signal(analysis, symbol, ma_period)
-        return await self.send_message(message)
-
     async def send_test_message(self) -> bool:
         """Send a test message to verify configuration"""
         message = format_test_message()
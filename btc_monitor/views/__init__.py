@@ -5,19 +5,25 @@ This module contains all user-facing message templates and formatting functions
 for different output channels (Telegram, console, backtest reports, etc.)
 """
 
-from btc_monitor.views.telegram import format_trade_signal, format_test_message
-from btc_monitor.views.console import format_analysis, format_startup_info, format_telegram_status
-from btc_monitor.views.backtest import (
-    format_statistics,
-    format_recent_opportunities,
-    format_header,
-    format_backtest_startup_info
-)
-from btc_monitor.views.test import (
-    format_test_start,
-    format_success_message,
-    format_error_message
-)
+import importlib
+
+# Public name -> submodule; resolved on first access (PEP 562) so importing one
+# view module (e.g. console in the monitor loop) does not load the others
+_LAZY_IMPORTS = {
+    'format_trade_signal': 'btc_monitor.views.telegram',
+    'format_test_message': 'btc_monitor.views.telegram',
+    'format_analysis': 'btc_monitor.views.console',
+    'format_analysis_summary': 'btc_monitor.views.console',
+    'format_startup_info': 'btc_monitor.views.console',
+    'format_telegram_status': 'btc_monitor.views.console',
+    'format_statistics': 'btc_monitor.views.backtest',
+    'format_recent_opportunities': 'btc_monitor.views.backtest',
+    'format_header': 'btc_monitor.views.backtest',
+    'format_backtest_startup_info': 'btc_monitor.views.backtest',
+    'format_test_start': 'btc_monitor.views.test',
+    'format_success_message': 'btc_monitor.views.test',
+    'format_error_message': 'btc_monitor.views.test',
+}
 
 __all__ = [
     # Telegram views
@@ -26,6 +32,7 @@ __all__ = [
 
     # Console views
     'format_analysis',
+    'format_analysis_summary',
     'format_startup_info',
     'format_telegram_status',
 
@@ -40,3 +47,19 @@ __all__ = [
     'format_success_message',
     'format_error_message',
 ]
+
+
+def __getattr__(name: str):
+    """Import the submodule that defines a public view on first access"""
+    module = _LAZY_IMPORTS.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    value = getattr(importlib.import_module(module), name)
+    globals()[name] = value  # Cache so later lookups skip __getattr__
+    return value
+
+
+def __dir__():
+    """Include lazily exported names in dir()"""
+    return sorted(list(globals()) + list(_LAZY_IMPORTS))
@@ -0,0 +1,23 @@
+"""
+Formatting helpers shared by the view modules
+"""
+
+
+def format_risk_reward(analysis: dict) -> str:
+    """
+    Format the risk/reward ratio of an analysis as "1:x.xx"
+
+    Args:
+        analysis: Analysis dictionary; 'risk_reward' is derived from
+            profit_percent/stop_percent when the key is missing
+
+    Returns:
+        Ratio string, or "n/a" when there is no stop distance (STOP_LOSS=0)
+    """
+    if 'risk_reward' in analysis:
+        ratio = analysis['risk_reward']
+    else:
+        stop_percent = analysis.get('stop_percent')
+        ratio = analysis['profit_percent'] / stop_percent if stop_percent else None
+
+    return f"1:{ratio:.2f}" if ratio is not None else "n/a"
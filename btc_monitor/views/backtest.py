@@ -4,8 +4,10 @@ Backtest report formatting
 Contains all backtest analysis report formatting functions.
 """
 
+import numpy as np
 import pandas as pd
-from typing import List, Dict
+
+_RULE = "=" * 80
 
 
 def format_header() -> str:
@@ -42,30 +44,31 @@ def format_backtest_startup_info(symbol: str, days: int, min_drop: float) -> str
     return output
 
 
-def format_statistics(results: List[Dict]) -> str:
+def format_statistics(df_results: pd.DataFrame) -> str:
     """
     Format comprehensive backtest statistics
 
     Args:
-        results: List of drop analysis results
+        df_results: DataFrame of drop analysis results
 
     Returns:
         Formatted statistics string
     """
-    if len(results) == 0:
+    if len(df_results) == 0:
         return "❌ No drops found in period"
 
-    df_results = pd.DataFrame(results)
     df_complete = df_results[df_results['max_gain_days'].notna()]
 
-    output = "="*80 + "\n"
+    output = _RULE + "\n"
     output += "📊 'BUY THE DIP' STRATEGY STATISTICS\n"
-    output += "="*80 + "\n"
+    output += _RULE + "\n"
+
+    drop_stats = df_results['drop_percent'].agg(['mean', 'min'])
 
     output += f"\n📉 DROPS ANALYZED:\n"
     output += f"   Total drops: {len(df_results)}\n"
-    output += f"   Average drop: {df_results['drop_percent'].mean():.2f}%\n"
-    output += f"   Largest drop: {df_results['drop_percent'].min():.2f}%\n"
+    output += f"   Average drop: {drop_stats['mean']:.2f}%\n"
+    output += f"   Largest drop: {drop_stats['min']:.2f}%\n"
 
     # By type
     if 'tipo' in df_results.columns:
@@ -81,59 +84,93 @@ def format_statistics(results: List[Dict]) -> str:
 
     if recovered > 0:
         df_recovered = df_results[df_results['recovered'] == True]
-        output += f"   Average time: {df_recovered['recovery_days'].mean():.1f} days\n"
-        output += f"   Fastest: {df_recovered['recovery_days'].min():.0f} days\n"
-        output += f"   Slowest: {df_recovered['recovery_days'].max():.0f} days\n"
+        days_stats = df_recovered['recovery_days'].agg(['mean', 'min', 'max'])
+        output += f"   Average time: {days_stats['mean']:.1f} days\n"
+        output += f"   Fastest: {days_stats['min']:.0f} days\n"
+        output += f"   Slowest: {days_stats['max']:.0f} days\n"
 
     if len(df_complete) > 0:
+        gain_stats = df_complete['max_gain_percent'].agg(['mean', 'min', 'max'])
         output += f"\n💰 POTENTIAL GAINS (7 days after):\n"
-        output += f"   Average gain: {df_complete['max_gain_percent'].mean():.2f}%\n"
-        output += f"   Largest gain: {df_complete['max_gain_percent'].max():.2f}%\n"
-        output += f"   Smallest: {df_complete['max_gain_percent'].min():.2f}%\n"
+        output += f"   Average gain: {gain_stats['mean']:.2f}%\n"
+        output += f"   Largest gain: {gain_stats['max']:.2f}%\n"
+        output += f"   Smallest: {gain_stats['min']:.2f}%\n"
 
-        # Win rate by thresholds
-        for threshold in [1.0, 2.0, 3.0]:
-            winning = (df_complete['max_gain_percent'] >= threshold).sum()
+        # Win rate by thresholds: one sort, then count gains >= each threshold
+        thresholds = [1.0, 2.0, 3.0]
+        sorted_gains = np.sort(df_complete['max_gain_percent'].to_numpy())
+        winning_counts = len(sorted_gains) - np.searchsorted(sorted_gains, thresholds, side='left')
+
+        for threshold, winning in zip(thresholds, winning_counts):
             win_rate = (winning / len(df_complete)) * 100
             output += f"\n🎯 WIN RATE (profit ≥{threshold}%):\n"
             output += f"   {win_rate:.1f}% ({winning}/{len(df_complete)})\n"
 
-    output += "\n" + "="*80 + "\n"
+    output += "\n" + _RULE + "\n"
     return output
 
 
-def format_recent_opportunities(results: List[Dict], n: int = 10) -> str:
+def format_recent_opportunities(df_results: pd.DataFrame, n: int = 10) -> str:
     """
     Format recent detected drops
 
     Args:
-        results: List of drop analysis results
+        df_results: DataFrame of drop analysis results
         n: Number of recent opportunities to show
 
     Returns:
         Formatted recent opportunities string
     """
-    if len(results) == 0:
+    if len(df_results) == 0:
         return ""
 
-    df_results = pd.DataFrame(results)
     recent = df_results.tail(n)
 
-    output = f"\n📅 LAST {min(n, len(results))} DETECTED DROPS:\n"
-    output += "="*80 + "\n"
+    output = f"\n📅 LAST {min(n, len(df_results))} DETECTED DROPS:\n"
+    output += _RULE + "\n"
+
+    # Format all dates in one vectorized pass instead of per-row strftime
+    date_strs = recent['date'].dt.strftime('%Y-%m-%d').to_numpy()
+
+    for date_str, row in zip(date_strs, recent.itertuples(index=False)):
+        output += f"\n📅 {date_str} [{getattr(row, 'tipo', 'N/A')}]\n"
+        output += f"   💸 Price: ${row.drop_price:,.2f}\n"
+        output += f"   📉 Drop: {row.drop_percent:.2f}%\n"
+
+        if row.recovered:
+            output += f"   ✅ Recovered in {row.recovery_days:.0f} days\n"
+
+        if pd.notna(row.max_gain_percent):
+            output += f"   📈 Max gain: {row.max_gain_percent:.2f}% in {row.max_gain_days:.0f} days\n"
+
+    output += "\n" + _RULE + "\n"
+    return output
+
+
+def format_grid_summary(summary: pd.DataFrame) -> str:
+    """
+    Format the per-combination summary of a backtest grid
 
-    for idx, row in recent.iterrows():
-        output += f"\n📅 {row['date']} [{row.get('tipo', 'N/A')}]\n"
-        output += f"   💸 Price: ${row['drop_price']:,.2f}\n"
-        output += f"   📉 Drop: {row['drop_percent']:.2f}%\n"
+    Args:
+        summary: DataFrame with symbol, min_drop, drops, recovery_rate and avg_gain columns
+
+    Returns:
+        Formatted summary table
+    """
+    if len(summary) == 0:
+        return "❌ No backtest results\n"
 
-        if row['recovered']:
-            output += f"   ✅ Recovered in {row['recovery_days']:.0f} days\n"
+    output = "\n" + _RULE + "\n"
+    output += "📊 BACKTEST GRID SUMMARY\n"
+    output += _RULE + "\n"
+    output += f"{'Symbol':<12}{'Min drop':>10}{'Drops':>8}{'Recovery':>11}{'Avg gain':>11}\n"
 
-        if pd.notna(row['max_gain_percent']):
-            output += f"   📈 Max gain: {row['max_gain_percent']:.2f}% in {row['max_gain_days']:.0f} days\n"
+    for row in summary.itertuples(index=False):
+        recovery = f"{row.recovery_rate:.1f}%" if pd.notna(row.recovery_rate) else "N/A"
+        gain = f"{row.avg_gain:.2f}%" if pd.notna(row.avg_gain) else "N/A"
+        output += f"{row.symbol:<12}{row.min_drop:>9.1f}%{row.drops:>8}{recovery:>11}{gain:>11}\n"
 
-    output += "\n" + "="*80 + "\n"
+    output += _RULE + "\n"
     return output
 
 
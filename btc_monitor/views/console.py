@@ -4,6 +4,42 @@ Console output formatting
 Contains all console/terminal output formatting for the monitor script.
 """
 
+from btc_monitor.views._common import format_risk_reward
+
+
+_RULE = "=" * 80
+
+_ANALYSIS_HEADER_TEMPLATE = (
+    "\n" + _RULE + "\n"
+    "⏰ {timestamp}\n"
+    "💰 CURRENT PRICE: USD {price:,.2f}\n"
+    + _RULE +
+    "\n\n📊 INDICATORS:\n"
+    "   MA{ma_period}: USD {ma:,.2f} ({ma_distance:+.2f}%)\n"
+    "   RSI(14): {rsi:.1f}\n"
+)
+
+_SIGNALS_TEMPLATE = "\n🚨 DETECTED SIGNALS (Score: {score}):\n{signals}"
+
+_LEVELS_TEMPLATE = (
+    "\n📍 KEY LEVELS:\n"
+    "   Resistances: {resistances}\n"
+    "   Supports: {supports}\n"
+)
+
+_ENTRY_TEMPLATE = (
+    f"\n{'🟢 ENTRY OPPORTUNITY DETECTED! 🟢':^80}\n"
+    "\n💡 TRADE SUGGESTION:\n"
+    "   🔹 ENTRY: USD {price:,.2f}\n"
+    "   🎯 TARGET: USD {target_price:,.2f} (+{profit_percent:.2f}%)\n"
+    "   🛑 STOP: USD {stop_loss:,.2f} (-{stop_percent:.2f}%)\n"
+    "   📊 RISK/REWARD: {risk_reward}\n"
+)
+
+_NO_ENTRY_TEMPLATE = "\n⚪ No clear opportunity at the moment (Score: {score}/7)\n"
+
+_ANALYSIS_FOOTER = "\n" + _RULE + "\n"
+
 
 def format_analysis(analysis: dict, ma_period: int) -> str:
     """
@@ -16,38 +52,40 @@ def format_analysis(analysis: dict, ma_period: int) -> str:
     Returns:
         Formatted analysis string for console output
     """
-    output = "\n" + "="*80 + "\n"
-    output += f"⏰ {analysis['timestamp']}\n"
-    output += f"💰 CURRENT PRICE: USD {analysis['price']:,.2f}\n"
-    output += "="*80
+    fields = {
+        **analysis,
+        'ma_period': ma_period,
+        'risk_reward': format_risk_reward(analysis),
+        'signals': ''.join(f"   {signal}\n" for signal in analysis['signals']),
+        'resistances': ', '.join(f'USD {r:,.0f}' for r in analysis['resistances'][:3]),
+        'supports': ', '.join(f'USD {s:,.0f}' for s in analysis['supports'][:3])
+    }
+
+    parts = [_ANALYSIS_HEADER_TEMPLATE.format_map(fields)]
+    if analysis['signals']:
+        parts.append(_SIGNALS_TEMPLATE.format_map(fields))
+    parts.append(_LEVELS_TEMPLATE.format_map(fields))
+    if analysis['entry_signal']:
+        parts.append(_ENTRY_TEMPLATE.format_map(fields))
+    else:
+        parts.append(_NO_ENTRY_TEMPLATE.format_map(fields))
+    parts.append(_ANALYSIS_FOOTER)
 
-    output += f"\n\n📊 INDICATORS:\n"
-    output += f"   MA{ma_period}: USD {analysis['ma']:,.2f} ({analysis['ma_distance']:+.2f}%)\n"
-    output += f"   RSI(14): {analysis['rsi']:.1f}\n"
+    return ''.join(parts)
 
-    if analysis['signals']:
-        output += f"\n🚨 DETECTED SIGNALS (Score: {analysis['score']}):\n"
-        for signal in analysis['signals']:
-            output += f"   {signal}\n"
 
-    output += f"\n📍 KEY LEVELS:\n"
-    output += f"   Resistances: {', '.join([f'USD {r:,.0f}' for r in analysis['resistances'][:3]])}\n"
-    output += f"   Supports: {', '.join([f'USD {s:,.0f}' for s in analysis['supports'][:3]])}\n"
+def format_analysis_summary(analysis: dict, symbol: str) -> str:
+    """
+    Format a one-line analysis summary for quiet (non-verbose) ticks
 
-    if analysis['entry_signal']:
-        output += f"\n{'🟢 ENTRY OPPORTUNITY DETECTED! 🟢':^80}\n"
-        output += f"\n💡 TRADE SUGGESTION:\n"
-        output += f"   🔹 ENTRY: USD {analysis['price']:,.2f}\n"
-        output += f"   🎯 TARGET: USD {analysis['target_price']:,.2f} (+{analysis['profit_percent']:.2f}%)\n"
-        output += f"   🛑 STOP: USD {analysis['stop_loss']:,.2f} (-{analysis['stop_percent']:.2f}%)\n"
-
-        risk_reward = analysis['profit_percent'] / analysis['stop_percent']
-        output += f"   📊 RISK/REWARD: 1:{risk_reward:.2f}\n"
-    else:
-        output += f"\n⚪ No clear opportunity at the moment (Score: {analysis['score']}/7)\n"
+    Args:
+        analysis: Analysis dictionary with signal data
+        symbol: Trading symbol
 
-    output += "\n" + "="*80 + "\n"
-    return output
+    Returns:
+        Single summary line
+    """
+    return f"[{symbol}] ⏰ {analysis['timestamp']} 💰 USD {analysis['price']:,.2f} | Score: {analysis['score']}/7\n"
 
 
 def format_startup_info(symbol: str, check_interval: int, min_drop: float, rsi_oversold: int) -> str:
@@ -4,6 +4,55 @@ Test script message formatting
 Contains all message formatting for the Telegram test script.
 """
 
+# Messages are assembled once at import time; the functions only return or fill them
+_TEST_START_TEMPLATE = (
+    "🧪 Testing Telegram Configuration...\n\n"
+    "Bot Token: {token_prefix}... (hidden for security)\n"
+    "Chat ID: {chat_id}\n"
+    "Enabled: {enabled}\n"
+    + "-" * 50 + "\n"
+)
+
+_TELEGRAM_DISABLED = (
+    "\n⚠️ Telegram is disabled in .env\n"
+    "   Set TELEGRAM_ENABLED=true in your .env file\n"
+)
+
+_CREDENTIALS_MISSING = (
+    "\n⚠️ Telegram credentials missing\n"
+    "   Add TELEGRAM_BOT_TOKEN and TELEGRAM_CHAT_ID to your .env file\n"
+)
+
+_BOT_INIT_FAILED = (
+    "   ❌ Failed to initialize bot\n"
+    "\n🔧 Troubleshooting:\n"
+    "   1. Verify your bot token is correct\n"
+    "   2. Check that your chat ID is correct\n"
+)
+
+_SUCCESS_MESSAGE = (
+    "   ✅ Test message sent successfully!\n"
+    "\n" + "=" * 50 + "\n"
+    "✅ SUCCESS! Check your Telegram app now.\n"
+    + "=" * 50 + "\n"
+    "\nYou should see a test message from your bot.\n"
+    "If you received it, your configuration is correct! 🎉\n"
+)
+
+_SEND_ERROR_MESSAGE = (
+    "   ❌ Failed to send test message\n"
+    "\n🔧 Troubleshooting:\n"
+    "   1. Verify your bot token is correct\n"
+    "   2. Make sure you sent at least one message to your bot\n"
+    "   3. Check that your chat ID is correct\n"
+    "   4. Ensure you have internet connection\n"
+)
+
+_ERROR_MESSAGES = {
+    'send': _SEND_ERROR_MESSAGE,
+    'init': _BOT_INIT_FAILED,
+}
+
 
 def format_test_start(bot_token: str, chat_id: str, enabled: bool) -> str:
     """
@@ -17,12 +66,7 @@ def format_test_start(bot_token: str, chat_id: str, enabled: bool) -> str:
     Returns:
         Formatted test start message
     """
-    output = "🧪 Testing Telegram Configuration...\n\n"
-    output += f"Bot Token: {bot_token[:20]}... (hidden for security)\n"
-    output += f"Chat ID: {chat_id}\n"
-    output += f"Enabled: {enabled}\n"
-    output += "-" * 50 + "\n"
-    return output
+    return _TEST_START_TEMPLATE.format(token_prefix=bot_token[:20], chat_id=chat_id, enabled=enabled)
 
 
 def format_telegram_disabled() -> str:
@@ -32,9 +76,7 @@ def format_telegram_disabled() -> str:
     Returns:
         Formatted disabled message
     """
-    output = "\n⚠️ Telegram is disabled in .env\n"
-    output += "   Set TELEGRAM_ENABLED=true in your .env file\n"
-    return output
+    return _TELEGRAM_DISABLED
 
 
 def format_credentials_missing() -> str:
@@ -44,9 +86,7 @@ def format_credentials_missing() -> str:
     Returns:
         Formatted credentials missing message
     """
-    output = "\n⚠️ Telegram credentials missing\n"
-    output += "   Add TELEGRAM_BOT_TOKEN and TELEGRAM_CHAT_ID to your .env file\n"
-    return output
+    return _CREDENTIALS_MISSING
 
 
 def format_init_bot() -> str:
@@ -66,11 +106,7 @@ def format_bot_init_failed() -> str:
     Returns:
         Formatted failure message with troubleshooting
     """
-    output = "   ❌ Failed to initialize bot\n"
-    output += "\n🔧 Troubleshooting:\n"
-    output += "   1. Verify your bot token is correct\n"
-    output += "   2. Check that your chat ID is correct\n"
-    return output
+    return _BOT_INIT_FAILED
 
 
 def format_bot_init_success() -> str:
@@ -100,13 +136,7 @@ def format_success_message() -> str:
     Returns:
         Formatted success message
     """
-    output = "   ✅ Test message sent successfully!\n"
-    output += "\n" + "=" * 50 + "\n"
-    output += "✅ SUCCESS! Check your Telegram app now.\n"
-    output += "=" * 50 + "\n"
-    output += "\nYou should see a test message from your bot.\n"
-    output += "If you received it, your configuration is correct! 🎉\n"
-    return output
+    return _SUCCESS_MESSAGE
 
 
 def format_error_message(error_type: str = "send") -> str:
@@ -119,10 +149,4 @@ def format_error_message(error_type: str = "send") -> str:
     Returns:
         Formatted error message with troubleshooting steps
     """
-    output = "   ❌ Failed to send test message\n"
-    output += "\n🔧 Troubleshooting:\n"
-    output += "   1. Verify your bot token is correct\n"
-    output += "   2. Make sure you sent at least one message to your bot\n"
-    output += "   3. Check that your chat ID is correct\n"
-    output += "   4. Ensure you have internet connection\n"
-    return output
+    return _ERROR_MESSAGES.get(error_type, _SEND_ERROR_MESSAGE)
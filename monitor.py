@@ -5,52 +5,140 @@ Supports multiple symbols in parallel
 """
 
 import asyncio
-from btc_monitor.binance_api import BinanceClient
+import time
+import pandas as pd
+import requests
+from btc_monitor.binance_api import BinanceClient, create_session
 from btc_monitor.indicators import analyze_opportunity
 from btc_monitor.telegram_bot import TelegramNotifier
 from btc_monitor.storage import SignalStorage
 from btc_monitor import settings
-from btc_monitor.views.console import format_analysis, format_startup_info, format_telegram_status
+from btc_monitor.views.console import (
+    format_analysis,
+    format_analysis_summary,
+    format_startup_info,
+    format_telegram_status
+)
+from btc_monitor.views.telegram import format_trade_signal
+
+TELEGRAM_BATCH_WINDOW = 2.0    # Seconds to collect signals from all symbols into one message
+TELEGRAM_MAX_LENGTH = 4096     # Telegram's per-message text limit
+TELEGRAM_SEPARATOR = "\n\n---\n\n"
 
 
 def print_analysis(analysis: dict, symbol: str):
-    """Print formatted analysis to console"""
-    output = format_analysis(analysis, settings.MA_PERIOD)
-    # Prefix with symbol for multi-symbol monitoring
-    print(f"[{symbol}] ", end="")
-    print(output, end="")
+    """Print formatted analysis to console (a one-line summary on quiet ticks unless VERBOSE)"""
+    if not settings.VERBOSE and not analysis['entry_signal']:
+        print(format_analysis_summary(analysis, symbol), end="")
+        return
 
+    output = format_analysis(analysis, settings.MA_PERIOD)
+    # Prefix with symbol for multi-symbol monitoring (one write keeps the block together)
+    print(f"[{symbol}] {output}", end="")
+
+
+def merge_latest_kline(df_historical: pd.DataFrame, latest: pd.DataFrame) -> pd.DataFrame:
+    """Replace (or append) the forming daily candle in the cached history"""
+    merged = pd.concat([df_historical, latest]).drop_duplicates('timestamp', keep='last')
+    return merged.reset_index(drop=True)
+
+
+def split_message(message: str, limit: int = TELEGRAM_MAX_LENGTH) -> list:
+    """Split a message longer than `limit` chars into pieces, at line breaks where possible"""
+    pieces = []
+    while len(message) > limit:
+        cut = message.rfind('\n', 0, limit + 1)
+        if cut <= 0:
+            cut = limit
+        pieces.append(message[:cut])
+        message = message[cut:].lstrip('\n')
+    if message:
+        pieces.append(message)
+    return pieces
+
+
+def pack_messages(messages: list, limit: int = TELEGRAM_MAX_LENGTH) -> list:
+    """Join messages with TELEGRAM_SEPARATOR into as few texts of at most `limit` chars as possible"""
+    batches = []
+    for message in messages:
+        for piece in split_message(message, limit):
+            if batches and len(batches[-1]) + len(TELEGRAM_SEPARATOR) + len(piece) <= limit:
+                batches[-1] += TELEGRAM_SEPARATOR + piece
+            else:
+                batches.append(piece)
+    return batches
+
+
+async def telegram_sender(telegram: TelegramNotifier, queue: asyncio.Queue):
+    """
+    Send queued notifications, coalescing everything that arrives within
+    TELEGRAM_BATCH_WINDOW into a single Telegram message
 
-async def monitor_symbol(symbol: str, telegram: TelegramNotifier = None):
+    Args:
+        telegram: Shared TelegramNotifier instance
+        queue: Queue of formatted messages filled by monitor_symbol
+    """
+    while True:
+        messages = [await queue.get()]
+        await asyncio.sleep(TELEGRAM_BATCH_WINDOW)
+        while True:
+            try:
+                messages.append(queue.get_nowait())
+            except asyncio.QueueEmpty:
+                break
+
+        # send_message reports its own failures
+        sent = [await telegram.send_message(batch) for batch in pack_messages(messages)]
+        if all(sent):
+            print(f"✅ Telegram notification sent ({len(messages)} signal(s))")
+
+
+async def monitor_symbol(symbol: str, notify_queue: asyncio.Queue = None,
+                         session: requests.Session = None):
     """
     Monitor a single symbol continuously
 
     Args:
         symbol: Trading symbol to monitor (e.g., BTCUSDT)
-        telegram: Shared TelegramNotifier instance
+        notify_queue: Shared queue drained by telegram_sender (None disables notifications)
+        session: Shared HTTP session (the client builds its own when None)
     """
     print(f"\n🚀 Starting monitor for {symbol}")
 
     # Initialize components for this symbol
-    client = BinanceClient(symbol=symbol)
+    client = BinanceClient(symbol=symbol, session=session)
     storage = SignalStorage(symbol=symbol)
 
+    # Daily history is pulled in full once per UTC day; in between, each tick
+    # only refreshes the forming candle
+    df_historical = None
+    history_day = None
+
     while True:
         try:
-            # Fetch current data
-            current_price = client.get_current_price()
-            if not current_price:
-                await asyncio.sleep(30)
-                continue
+            today = time.strftime('%Y-%m-%d', time.gmtime())
+            full_refresh = df_historical is None or history_day != today
+            if full_refresh:
+                fetch_history = asyncio.to_thread(client.get_historical_klines, settings.HISTORICAL_DAYS)
+            else:
+                fetch_history = asyncio.to_thread(client.get_latest_kline)
+
+            # Fetch 24h stats (which carry the last price) and history concurrently in
+            # worker threads so the blocking requests neither serialize nor stall the other symbols
+            stats_24h, klines = await asyncio.gather(
+                asyncio.to_thread(client.get_24h_stats),
+                fetch_history
+            )
+            current_price = stats_24h['price'] if stats_24h else None
 
-            stats_24h = client.get_24h_stats()
-            if not stats_24h:
-                await asyncio.sleep(30)
-                continue
+            if klines is not None and len(klines) > 0:
+                if full_refresh:
+                    df_historical = klines
+                    history_day = today
+                else:
+                    df_historical = merge_latest_kline(df_historical, klines)
 
-            # Fetch historical data
-            df_historical = client.get_historical_klines(settings.HISTORICAL_DAYS)
-            if df_historical is None or len(df_historical) == 0:
+            if not current_price or not stats_24h or df_historical is None or len(df_historical) == 0:
                 await asyncio.sleep(30)
                 continue
 
@@ -76,13 +164,9 @@ async def monitor_symbol(symbol: str, telegram: TelegramNotifier = None):
             if analysis['entry_signal']:
                 storage.save_signal(analysis)
 
-                if telegram:
-                    await telegram.send_trade_signal(
-                        analysis,
-                        symbol,
-                        settings.MA_PERIOD
-                    )
-                    print(f"[{symbol}] ✅ Telegram notification sent")
+                if notify_queue is not None:
+                    await notify_queue.put(format_trade_signal(analysis, symbol, settings.MA_PERIOD))
+                    print(f"[{symbol}] 📨 Telegram notification queued")
 
             # Wait for next check
             await asyncio.sleep(settings.CHECK_INTERVAL)
@@ -119,10 +203,19 @@ async def run_monitor_async():
     else:
         print(format_telegram_status(False))
 
-    # Create monitoring tasks for each symbol
+    # Create monitoring tasks for each symbol, plus one sender batching their notifications
     tasks = []
+    notify_queue = None
+    if telegram:
+        notify_queue = asyncio.Queue()
+        tasks.append(asyncio.create_task(telegram_sender(telegram, notify_queue)))
+
+    # One keep-alive pool for every symbol, sized for their two concurrent calls per tick
+    # (24h stats + latest kline or full history)
+    session = create_session(pool_maxsize=2 * len(settings.SYMBOLS))
+
     for symbol in settings.SYMBOLS:
-        task = asyncio.create_task(monitor_symbol(symbol, telegram))
+        task = asyncio.create_task(monitor_symbol(symbol, notify_queue, session))
         tasks.append(task)
 
     # Run all tasks concurrently
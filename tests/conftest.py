@@ -10,6 +10,23 @@ import numpy as np
 from datetime import datetime, timedelta
 
 
+def pytest_configure(config):
+    """Register the xdist_group marker so runs without pytest-xdist do not warn"""
+    config.addinivalue_line("markers", "xdist_group(name): run tests sharing a name on one xdist worker")
+
+
+def pytest_collection_modifyitems(config, items):
+    """
+    Keep each test module on a single xdist worker
+
+    Under `pytest -n auto --dist loadgroup` the session-scoped scenarios are
+    then built once per module rather than once per worker. Without
+    pytest-xdist the marker has no effect.
+    """
+    for item in items:
+        item.add_marker(pytest.mark.xdist_group(item.module.__name__.rsplit('.', 1)[-1]))
+
+
 def create_mock_historical_data(
     days: int = 90,
     base_price: float = 100000,
@@ -109,66 +126,81 @@ def create_price_with_indicators(
         DataFrame configured to produce desired indicators
     """
     days = 90
+    rng = np.random.default_rng()
 
     # Create prices that will result in desired MA
     # Recent prices oscillate around MA target
-    prices = []
-    for i in range(days - 7):
-        prices.append(ma_value * (1 + np.random.randn() * 0.01))
+    prices = ma_value * (1 + rng.standard_normal(days - 7) * 0.01)
 
     # Last 7 days adjust to hit target MA
     # MA = average of last 7 days
     sum_needed = ma_value * 7
-    sum_so_far = sum(prices[-6:]) if len(prices) >= 6 else 0
-    prices.append(sum_needed - sum_so_far)
+    prices = np.append(prices, sum_needed - prices[-6:].sum())
 
     # Adjust for RSI (simplified - last price determines RSI trend)
     if rsi_value < 30:  # Oversold - recent downtrend
-        for i in range(len(prices) - 14, len(prices)):
-            prices[i] *= (1 - 0.02)  # Gradual decline
+        prices[-14:] *= (1 - 0.02)  # Gradual decline
     elif rsi_value > 70:  # Overbought - recent uptrend
-        for i in range(len(prices) - 14, len(prices)):
-            prices[i] *= (1 + 0.02)  # Gradual increase
+        prices[-14:] *= (1 + 0.02)  # Gradual increase
 
     # Set last price to current price
     prices[-1] = current_price
 
-    # Build DataFrame
-    dates = pd.date_range(end=datetime.now(), periods=len(prices), freq='D')
-    data = []
-
-    for date, close in zip(dates, prices):
-        daily_range = close * 0.01
-        data.append({
-            'date': date,
-            'open': close,
-            'high': close + abs(np.random.randn() * daily_range),
-            'low': close - abs(np.random.randn() * daily_range),
-            'close': close,
-            'volume': 1000
-        })
+    # Build OHLC columns
+    n = len(prices)
+    daily_range = prices * 0.01
+    high = prices + np.abs(rng.standard_normal(n) * daily_range)
+    low = prices - np.abs(rng.standard_normal(n) * daily_range)
+    close = prices.copy()
 
     # Add support/resistance levels to the data
     if supports:
-        for support in supports:
-            # Add historical touches at support
-            idx = np.random.randint(0, len(data) - 20)
-            data[idx]['low'] = support
-            data[idx]['close'] = support * 1.002
+        # Add historical touches at support
+        idx = rng.integers(0, n - 20, size=len(supports))
+        low[idx] = supports
+        close[idx] = np.asarray(supports, dtype=np.float64) * 1.002
 
     if resistances:
-        for resistance in resistances:
-            # Add historical touches at resistance
-            idx = np.random.randint(0, len(data) - 20)
-            data[idx]['high'] = resistance
-            data[idx]['close'] = resistance * 0.998
+        # Add historical touches at resistance
+        idx = rng.integers(0, n - 20, size=len(resistances))
+        high[idx] = resistances
+        close[idx] = np.asarray(resistances, dtype=np.float64) * 0.998
+
+    return pd.DataFrame({
+        'date': pd.date_range(end=datetime.now(), periods=n, freq='D'),
+        'open': prices,
+        'high': high,
+        'low': low,
+        'close': close,
+        'volume': 1000
+    })
+
+
+def read_only(df: pd.DataFrame) -> pd.DataFrame:
+    """
+    Copy a DataFrame into column arrays that reject writes
 
-    return pd.DataFrame(data)
+    Session-scoped scenarios are shared by every test, so any in-place
+    change raises ValueError instead of leaking into later tests.
+
+    Args:
+        df: DataFrame to freeze
+
+    Returns:
+        DataFrame backed by read-only NumPy arrays
+    """
+    columns = {}
+    for name in df.columns:
+        values = df[name].to_numpy(copy=True)
+        values.flags.writeable = False
+        columns[name] = values
+
+    return pd.DataFrame(columns, copy=False)
 
 
-# Pytest Fixtures
+# Pytest Fixtures (session-scoped: each scenario is built once and shared read-only)
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def scenario_strong_buy():
     """
     Strong buy signal scenario:
@@ -189,10 +221,10 @@ def scenario_strong_buy():
 
     stats_24h = create_mock_stats_24h(price_change_percent=-6.0)
 
-    return current_price, stats_24h, df
+    return current_price, stats_24h, read_only(df)
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def scenario_no_signal():
     """
     No signal scenario:
@@ -213,10 +245,10 @@ def scenario_no_signal():
 
     stats_24h = create_mock_stats_24h(price_change_percent=-2.0)
 
-    return current_price, stats_24h, df
+    return current_price, stats_24h, read_only(df)
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def scenario_partial_signal():
     """
     Partial signal scenario:
@@ -237,10 +269,10 @@ def scenario_partial_signal():
 
     stats_24h = create_mock_stats_24h(price_change_percent=-5.5)
 
-    return current_price, stats_24h, df
+    return current_price, stats_24h, read_only(df)
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def scenario_conservative_target():
     """
     Scenario to test conservative target calculation:
@@ -261,10 +293,10 @@ def scenario_conservative_target():
 
     stats_24h = create_mock_stats_24h(price_change_percent=-5.5)
 
-    return current_price, stats_24h, df
+    return current_price, stats_24h, read_only(df)
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def scenario_near_support():
     """
     Scenario where price is near support level:
@@ -285,4 +317,4 @@ def scenario_near_support():
 
     stats_24h = create_mock_stats_24h(price_change_percent=-3.0)
 
-    return current_price, stats_24h, df
+    return current_price, stats_24h, read_only(df)
@@ -0,0 +1,67 @@
+"""
+Unit tests for the backtest grid
+
+Runs the grid worker in-process on mock klines and checks the summary table.
+"""
+
+import numpy as np
+import pandas as pd
+import pytest
+from backtest import _grid_worker, analyze_recovery
+from btc_monitor.indicators import find_drops_advanced
+from btc_monitor.views.backtest import format_grid_summary
+from tests.conftest import create_mock_historical_data
+
+
+@pytest.fixture(scope="session")
+def grid_klines():
+    """Volatile mock klines, keyed by 'timestamp' like the Binance client output"""
+    df = create_mock_historical_data(days=120, trend="volatile", volatility=0.04)
+    return df.rename(columns={'date': 'timestamp'})
+
+
+class TestGridWorker:
+    """Tests for the per-combination grid worker"""
+
+    def test_summary_matches_direct_analysis(self, grid_klines):
+        """Worker summary should agree with running detection + recovery directly"""
+        summary = _grid_worker("BTCUSDT", 5.0, grid_klines)
+        results = pd.DataFrame(analyze_recovery(grid_klines, find_drops_advanced(grid_klines, 5.0)))
+
+        assert summary['symbol'] == "BTCUSDT"
+        assert summary['min_drop'] == 5.0
+        assert summary['drops'] == len(results) > 0
+        assert summary['recovery_rate'] == pytest.approx(results['recovered'].mean() * 100)
+        assert 0 <= summary['recovery_rate'] <= 100
+
+    def test_no_drops_gives_nan_rates(self, grid_klines):
+        """A threshold no day reaches should summarize as zero drops with NaN rates"""
+        summary = _grid_worker("BTCUSDT", 99.0, grid_klines)
+
+        assert summary['drops'] == 0
+        assert np.isnan(summary['recovery_rate'])
+        assert np.isnan(summary['avg_gain'])
+
+
+class TestGridSummaryView:
+    """Tests for format_grid_summary"""
+
+    def test_formats_rows_and_missing_values(self):
+        """Each combination should be one row, with N/A for missing rates"""
+        summary = pd.DataFrame([
+            {'symbol': 'BTCUSDT', 'min_drop': 5.0, 'drops': 12, 'recovery_rate': 75.0, 'avg_gain': 3.456},
+            {'symbol': 'ETHUSDT', 'min_drop': 10.0, 'drops': 0, 'recovery_rate': np.nan, 'avg_gain': np.nan},
+        ])
+
+        output = format_grid_summary(summary)
+
+        assert "BACKTEST GRID SUMMARY" in output
+        assert "BTCUSDT" in output and "5.0%" in output and "75.0%" in output and "3.46%" in output
+        eth_row = next(line for line in output.splitlines() if line.startswith("ETHUSDT"))
+        assert eth_row.count("N/A") == 2
+
+    def test_empty_summary(self):
+        """An empty grid should report that there are no results"""
+        empty = pd.DataFrame(columns=['symbol', 'min_drop', 'drops', 'recovery_rate', 'avg_gain'])
+
+        assert format_grid_summary(empty) == "❌ No backtest results\n"
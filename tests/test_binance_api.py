@@ -0,0 +1,150 @@
+"""
+Unit tests for the Binance client
+
+Serves synthetic daily klines from a fake session (no network) to check the
+klines cache and the chunked range fetch.
+"""
+
+import os
+import time
+import orjson
+import pandas as pd
+import pytest
+import requests
+from btc_monitor.binance_api import BinanceClient, DAY_MS, KLINES_LIMIT
+
+
+class FakeResponse:
+    """Minimal stand-in for requests.Response"""
+
+    def __init__(self, payload):
+        self.content = orjson.dumps(payload)
+
+    def raise_for_status(self):
+        pass
+
+
+class FakeSession(requests.Session):
+    """
+    Session answering klines requests with one candle per UTC day
+
+    Every candle closes at `close`; each request's (startTime, endTime) is
+    recorded. With `fail` set, every request raises a connection error.
+    """
+
+    def __init__(self, close: float = 2.0, fail: bool = False):
+        super().__init__()
+        self.close = close
+        self.fail = fail
+        self.requests = []
+
+    def get(self, url, params=None, **kwargs):
+        if self.fail:
+            raise requests.ConnectionError("network down")
+        start, end = params['startTime'], params['endTime']
+        self.requests.append((start, end))
+        first = -(-start // DAY_MS) * DAY_MS  # first day boundary at or after start
+        rows = [[t, self.close, self.close, self.close, self.close, 1.0]
+                for t in range(first, end + 1, DAY_MS)]
+        return FakeResponse(rows[:params['limit']])
+
+
+def make_klines(first_day: int, last_day: int, close: float = 1.0) -> pd.DataFrame:
+    """Daily klines for days first_day..last_day relative to today (0 = today's candle)"""
+    today = time.time_ns() // 1_000_000 // DAY_MS * DAY_MS
+    timestamps = pd.to_datetime([today + d * DAY_MS for d in range(first_day, last_day + 1)], unit='ms')
+    return pd.DataFrame({
+        'timestamp': timestamps,
+        'open': close, 'high': close, 'low': close, 'close': close, 'volume': 1.0
+    })
+
+
+def make_client(tmp_path, session, cached: pd.DataFrame = None, age: float = 0) -> BinanceClient:
+    """Client caching under tmp_path, optionally seeded with a cache file `age` seconds old"""
+    client = BinanceClient(cache_dir=str(tmp_path), cache_ttl=3600, session=session)
+    if cached is not None:
+        path = client._cache_path('1d', 10)
+        cached.to_pickle(path)
+        mtime = time.time() - age
+        os.utime(path, (mtime, mtime))
+    return client
+
+
+class TestHistoricalCache:
+    """Tests for the klines cache in get_historical_with_retry"""
+
+    def test_fresh_cache_skips_fetch(self, tmp_path):
+        """A cache younger than the TTL should be returned without any request"""
+        cached = make_klines(-9, 0)
+        session = FakeSession(fail=True)
+
+        df = make_client(tmp_path, session, cached).get_historical_with_retry(10)
+
+        pd.testing.assert_frame_equal(df, cached)
+
+    def test_expired_cache_is_merged_and_trimmed(self, tmp_path):
+        """An expired cache should only be extended from its last candle, then trimmed to the window"""
+        stale = make_klines(-15, -3)
+        session = FakeSession(close=2.0)
+        client = make_client(tmp_path, session, stale, age=7200)
+
+        df = client.get_historical_with_retry(10)
+
+        # Only the delta from the last cached candle was requested
+        assert len(session.requests) == 1
+        assert session.requests[0][0] == stale['timestamp'].iloc[-1].value // 1_000_000
+
+        assert df['timestamp'].iloc[0] == make_klines(-9, -9)['timestamp'].iloc[0]
+        assert df['timestamp'].is_monotonic_increasing and df['timestamp'].is_unique
+        assert list(df.index) == list(range(len(df)))
+
+        # keep='last': the refetched last cached candle carries the fresh close
+        fresh = df.set_index('timestamp')['close']
+        assert fresh[stale['timestamp'].iloc[-1]] == 2.0
+        assert fresh[stale['timestamp'].iloc[-2]] == 1.0
+        assert fresh.index[-1] == make_klines(0, 0)['timestamp'].iloc[0]
+
+        # The merged result replaces the cache
+        pd.testing.assert_frame_equal(pd.read_pickle(client._cache_path('1d', 10)), df)
+
+    def test_fetch_failure_falls_back_to_stale_cache(self, tmp_path, capsys):
+        """A failed fetch should return the expired cache trimmed to the window and report the error"""
+        stale = make_klines(-15, -3)
+        client = make_client(tmp_path, FakeSession(fail=True), stale, age=7200)
+
+        df = client.get_historical_with_retry(10)
+
+        # Days -15..-10 fall outside the 10-day window
+        pd.testing.assert_frame_equal(df, stale.iloc[6:].reset_index(drop=True))
+        assert "network down" in capsys.readouterr().out
+
+    def test_fetch_failure_without_cache(self, tmp_path):
+        """Without any cache a failed fetch should still give None"""
+        client = make_client(tmp_path, FakeSession(fail=True))
+
+        assert client.get_historical_with_retry(10) is None
+
+
+class TestKlinesRange:
+    """Tests for splitting long windows into per-request chunks"""
+
+    @pytest.mark.parametrize("days", [1000, 1001, 2500])
+    def test_chunks_tile_the_window(self, days):
+        """Chunk windows should be contiguous, non-overlapping and merge in chronological order"""
+        session = FakeSession()
+        client = BinanceClient(session=session)
+        start_time = 1_600_000_000_000 // DAY_MS * DAY_MS
+        end_time = start_time + days * DAY_MS
+
+        rows = client._get_klines_range(start_time, end_time)
+
+        windows = sorted(session.requests)
+        assert len(windows) == -(-(days + 1) // KLINES_LIMIT)
+        assert windows[0][0] == start_time
+        assert windows[-1][1] == end_time
+        for (_, prev_end), (next_start, _) in zip(windows, windows[1:]):
+            assert next_start == prev_end + 1
+        assert all(start <= end and end - start < KLINES_LIMIT * DAY_MS for start, end in windows)
+
+        open_times = [row[0] for row in rows]
+        assert open_times == list(range(start_time, end_time + 1, DAY_MS))
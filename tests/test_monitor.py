@@ -0,0 +1,104 @@
+"""
+Unit tests for the monitor loop helpers
+
+Tests how the forming candle is merged into the cached history and how
+queued Telegram notifications are packed into messages.
+"""
+
+import pandas as pd
+from monitor import merge_latest_kline, pack_messages, split_message, TELEGRAM_SEPARATOR
+
+SEP = len(TELEGRAM_SEPARATOR)
+
+
+def make_klines(days, closes) -> pd.DataFrame:
+    """Daily klines for the given days and closes"""
+    return pd.DataFrame({
+        'timestamp': pd.to_datetime(days),
+        'open': closes, 'high': closes, 'low': closes, 'close': closes, 'volume': 1.0
+    })
+
+
+class TestMergeLatestKline:
+    """Tests for refreshing the forming daily candle between full history fetches"""
+
+    def test_forming_candle_replaces_same_day(self):
+        """A candle with the last row's timestamp should overwrite it, not duplicate it"""
+        history = make_klines(['2024-01-01', '2024-01-02', '2024-01-03'], [1.0, 2.0, 3.0])
+        latest = make_klines(['2024-01-03'], [3.5])
+
+        merged = merge_latest_kline(history, latest)
+
+        assert list(merged['timestamp']) == list(history['timestamp'])
+        assert list(merged['close']) == [1.0, 2.0, 3.5]
+        assert list(merged.index) == [0, 1, 2]
+
+    def test_new_day_candle_is_appended(self):
+        """A candle for a new day should be appended with a reset index"""
+        history = make_klines(['2024-01-01', '2024-01-02', '2024-01-03'], [1.0, 2.0, 3.0])
+        latest = make_klines(['2024-01-04'], [4.0])
+
+        merged = merge_latest_kline(history, latest)
+
+        assert list(merged['timestamp']) == list(pd.to_datetime(
+            ['2024-01-01', '2024-01-02', '2024-01-03', '2024-01-04']))
+        assert list(merged['close']) == [1.0, 2.0, 3.0, 4.0]
+        assert list(merged.index) == [0, 1, 2, 3]
+        assert len(history) == 3
+
+
+class TestPackMessages:
+    """Tests for batching notifications under Telegram's length limit"""
+
+    def test_joins_messages_that_fit(self):
+        """Messages that fit together should become one separator-joined text"""
+        assert pack_messages(["a", "b", "c"], limit=100) == [TELEGRAM_SEPARATOR.join("abc")]
+
+    def test_exact_limit_boundary(self):
+        """A batch of exactly `limit` chars, separator included, should still be joined"""
+        first, second = "x" * 10, "y" * 10
+        limit = len(first) + SEP + len(second)
+
+        assert pack_messages([first, second], limit=limit) == [first + TELEGRAM_SEPARATOR + second]
+        assert pack_messages([first, second], limit=limit - 1) == [first, second]
+
+    def test_separator_counts_toward_limit(self):
+        """Messages whose text alone fits but not with the separator should be split"""
+        first, second = "x" * 10, "y" * 10
+        limit = len(first) + len(second) + SEP - 1
+
+        assert pack_messages([first, second], limit=limit) == [first, second]
+
+    def test_every_batch_within_limit(self):
+        """No packed text should exceed the limit"""
+        messages = [("m%d " % i) * (i + 1) for i in range(40)]
+
+        batches = pack_messages(messages, limit=120)
+
+        assert all(len(batch) <= 120 for batch in batches)
+        assert "".join(batches).replace(TELEGRAM_SEPARATOR, "") == "".join(messages)
+
+    def test_oversized_message_is_split(self):
+        """A single message longer than the limit should be split, not sent as-is"""
+        message = "\n".join(f"line {i:02d}" for i in range(20))  # 20 lines of 7 chars
+
+        batches = pack_messages([message], limit=30)
+
+        assert all(len(batch) <= 30 for batch in batches)
+        assert "\n".join(batches) == message
+
+
+class TestSplitMessage:
+    """Tests for splitting one message longer than the limit"""
+
+    def test_short_message_unchanged(self):
+        """A message within the limit should come back as a single piece"""
+        assert split_message("hello", limit=5) == ["hello"]
+
+    def test_splits_at_line_breaks(self):
+        """Pieces should end at the last line break that fits"""
+        assert split_message("aaa\nbbb\nccc", limit=8) == ["aaa\nbbb", "ccc"]
+
+    def test_hard_split_without_line_breaks(self):
+        """A line longer than the limit should be cut at the limit"""
+        assert split_message("x" * 25, limit=10) == ["x" * 10, "x" * 10, "x" * 5]
@@ -0,0 +1,127 @@
+"""
+Unit tests for signal storage
+
+Tests the append-only JSONL log: legacy migration, save/load round trips,
+torn writes and the tail reader behind get_latest.
+"""
+
+import json
+import numpy as np
+import pytest
+from btc_monitor.storage import SignalStorage, TAIL_SIZE, TAIL_BLOCK
+
+
+def make_signal(i: int) -> dict:
+    """Signal-shaped record with a recognizable index"""
+    return {'timestamp': f'2024-01-01 00:00:{i:05d}', 'price': 100000.0 + i, 'score': i % 8}
+
+
+def write_log(path, signals) -> None:
+    """Write signals straight to a JSONL file, bypassing SignalStorage"""
+    with open(path, 'w') as f:
+        for signal in signals:
+            f.write(json.dumps(signal) + '\n')
+
+
+class TestMigration:
+    """Tests for converting legacy JSON-array logs"""
+
+    def test_migrates_legacy_symbol_file(self, tmp_path, monkeypatch):
+        """signals_X.json (array) should be converted to signals_X.jsonl"""
+        monkeypatch.chdir(tmp_path)
+        legacy = [make_signal(i) for i in range(3)]
+        (tmp_path / 'signals_BTCUSDT.json').write_text(json.dumps(legacy, indent=2))
+
+        storage = SignalStorage(symbol='BTCUSDT')
+
+        assert storage.filepath == 'signals_BTCUSDT.jsonl'
+        assert storage.load_all() == legacy
+        lines = (tmp_path / 'signals_BTCUSDT.jsonl').read_text().splitlines()
+        assert [json.loads(line) for line in lines] == legacy
+
+    def test_migrates_array_in_place(self, tmp_path):
+        """A JSON array stored under the .jsonl name should be rewritten as lines"""
+        path = tmp_path / 'signals.jsonl'
+        legacy = [make_signal(i) for i in range(2)]
+        path.write_text(json.dumps(legacy))
+
+        assert SignalStorage(filepath=str(path)).load_all() == legacy
+        assert len(path.read_text().splitlines()) == 2
+
+
+class TestSaveLoad:
+    """Tests for appending and reading signals"""
+
+    def test_round_trip(self, tmp_path):
+        """Saved signals should load back in order, with numpy values as plain JSON"""
+        path = str(tmp_path / 'signals.jsonl')
+        storage = SignalStorage(filepath=path)
+
+        assert storage.save_signal(make_signal(0)) is True
+        assert storage.save_signal({**make_signal(1), 'rsi': np.float64(25.5), 'ma': np.nan})
+
+        expected = [make_signal(0), {**make_signal(1), 'rsi': 25.5, 'ma': None}]
+        assert storage.load_all() == expected
+        assert SignalStorage(filepath=path).load_all() == expected
+
+    def test_truncated_last_line_is_skipped(self, tmp_path):
+        """A torn final write should not hide the complete records before it"""
+        path = tmp_path / 'signals.jsonl'
+        write_log(path, [make_signal(0), make_signal(1)])
+        with open(path, 'a') as f:
+            f.write('{"timestamp": "2024-01-01 00:00:00002", "pri')
+
+        assert SignalStorage(filepath=str(path)).load_all() == [make_signal(0), make_signal(1)]
+        assert SignalStorage(filepath=str(path)).get_latest(5) == [make_signal(0), make_signal(1)]
+
+    def test_save_after_truncated_line_survives_reload(self, tmp_path):
+        """A signal saved after a torn write should start its own line and reload"""
+        path = tmp_path / 'signals.jsonl'
+        path.write_text('{"a": 0}\n{"a": 1, "pri')
+
+        assert SignalStorage(filepath=str(path)).save_signal({'a': 2}) is True
+
+        assert SignalStorage(filepath=str(path)).load_all() == [{'a': 0}, {'a': 2}]
+        assert SignalStorage(filepath=str(path)).get_latest(5) == [{'a': 0}, {'a': 2}]
+
+    def test_missing_file_is_empty(self, tmp_path):
+        """No log file yet should read as no signals"""
+        storage = SignalStorage(filepath=str(tmp_path / 'signals.jsonl'))
+
+        assert storage.load_all() == []
+        assert storage.get_latest() == []
+
+
+class TestGetLatest:
+    """Tests for get_latest across the tail and full-load paths"""
+
+    @pytest.mark.parametrize("n", [0, -3, 1, 10, TAIL_SIZE, TAIL_SIZE + 1, 1000])
+    def test_matches_full_log_slice(self, tmp_path, n):
+        """get_latest(n) should equal load_all()[-n:] for any n"""
+        path = tmp_path / 'signals.jsonl'
+        signals = [make_signal(i) for i in range(TAIL_SIZE + 50)]
+        write_log(path, signals)
+
+        assert SignalStorage(filepath=str(path)).get_latest(n) == signals[-n:]
+
+    def test_log_larger_than_one_block(self, tmp_path):
+        """The backwards reader should stitch lines across 64 KiB block edges"""
+        path = tmp_path / 'signals.jsonl'
+        signals = [{**make_signal(i), 'note': 'x' * 500} for i in range(1000)]
+        write_log(path, signals)
+        assert path.stat().st_size > 2 * TAIL_BLOCK
+
+        assert SignalStorage(filepath=str(path)).get_latest(TAIL_SIZE) == signals[-TAIL_SIZE:]
+        assert SignalStorage(filepath=str(path)).get_latest(3) == signals[-3:]
+
+    def test_tail_follows_new_saves(self, tmp_path):
+        """Signals saved after the tail is read should show up in get_latest"""
+        path = tmp_path / 'signals.jsonl'
+        write_log(path, [make_signal(i) for i in range(TAIL_SIZE)])
+        storage = SignalStorage(filepath=str(path))
+
+        assert storage.get_latest(1) == [make_signal(TAIL_SIZE - 1)]
+        storage.save_signal(make_signal(TAIL_SIZE))
+
+        assert storage.get_latest(2) == [make_signal(TAIL_SIZE - 1), make_signal(TAIL_SIZE)]
+        assert storage.get_latest(TAIL_SIZE) == [make_signal(i) for i in range(1, TAIL_SIZE + 1)]
@@ -5,30 +5,105 @@ Tests the analyze_opportunity function with various market scenarios
 to ensure correct signal generation and target/stop loss calculation.
 """
 
+import re
+import numpy as np
+import pandas as pd
 import pytest
-from btc_monitor.indicators import analyze_opportunity
+from btc_monitor._kernels import strongest_drops
+from btc_monitor.indicators import analyze_opportunity, calculate_rsi
+from btc_monitor.views import format_analysis, format_trade_signal
+from tests.conftest import create_mock_historical_data, create_mock_stats_24h, create_price_with_indicators
+
+# Strategy parameters shared by every analyze_opportunity call
+DEFAULT_PARAMS = {
+    "min_drop": 5.0,
+    "ma_distance": 3.0,
+    "rsi_oversold": 30,
+    "ma_period": 7,
+    "stop_loss": 3.0,
+    "take_profit": 2.0,
+    "max_take_profit": 5.0,
+    "resistance_factor": 0.6,
+}
+
+
+def _analyze(current_price, stats_24h, df):
+    """Run analyze_opportunity with DEFAULT_PARAMS"""
+    return analyze_opportunity(
+        current_price=current_price,
+        stats_24h=stats_24h,
+        df_historical=df,
+        **DEFAULT_PARAMS
+    )
+
+
+# Signal markers emitted by analyze_opportunity
+SIGNAL_PATTERNS = re.compile(r"24H DROP|NEAR SUPPORT|RSI OVERSOLD|BELOW MA")
+
+
+def _reference_drops(close, high, low, window=30):
+    """Pandas reference for strongest_drops: argmin over the three methods, NaN never wins"""
+    close, high, low = pd.Series(close), pd.Series(high), pd.Series(low)
+    rolling_max = high.rolling(window, min_periods=1).max()
+    changes = np.vstack([
+        (close.pct_change() * 100).to_numpy(),
+        ((low - rolling_max) / rolling_max * 100).to_numpy(),
+        ((low - high) / high * 100).to_numpy(),
+    ])
+    changes = np.where(np.isnan(changes), np.inf, changes)
+    codes = changes.argmin(axis=0)  # first (lowest) code wins ties
+    return codes, changes[codes, np.arange(changes.shape[1])]
+
+
+def _random_ohlc(rng, days, levels=None):
+    """Random (close, high, low); with `levels`, prices are drawn from a few integers so methods tie"""
+    if levels:
+        close = rng.integers(1, levels + 1, days).astype(float)
+        high = close + rng.integers(0, 2, days)
+        low = close - rng.integers(0, 2, days) * 0.5
+    else:
+        close = 100 * np.exp(np.cumsum(rng.normal(0, 0.03, days)))
+        high = close * (1 + rng.uniform(0, 0.05, days))
+        low = close * (1 - rng.uniform(0, 0.05, days))
+    return close, high, low
+
+
+def _signal_kinds(analysis):
+    """Set of signal markers found in analysis['signals']"""
+    return set(SIGNAL_PATTERNS.findall("\n".join(analysis['signals'])))
+
+
+# (field, predicate) pairs checked against the strong buy analysis
+STRONG_BUY_CHECKS = [
+    ("stop_loss", lambda a: a['stop_loss'] is not None and a['stop_loss'] < a['price']),
+    ("stop_percent", lambda a: (a['stop_percent'] is not None and a['stop_percent'] > 0
+                                and a['stop_percent'] == pytest.approx(3.0, abs=3.0))),
+    ("profit_percent", lambda a: a['profit_percent'] > 0),
+    ("risk_reward", lambda a: (a['risk_reward'] > 0
+                               and a['risk_reward'] == pytest.approx(a['profit_percent'] / a['stop_percent']))),
+    ("ma", lambda a: a['ma'] > 0),
+    ("ma_distance", lambda a: 'ma_distance' in a),
+    ("rsi", lambda a: 0 <= a['rsi'] <= 100),
+    ("supports", lambda a: len(a['supports']) > 0),
+    ("resistances", lambda a: len(a['resistances']) > 0),
+]
+
+
+@pytest.fixture(scope="session")
+def analyzed_strong_buy(scenario_strong_buy):
+    """analyze_opportunity result for scenario_strong_buy, computed once per session"""
+    current_price, stats_24h, df = scenario_strong_buy
+
+    return _analyze(current_price, stats_24h, df)
 
 
 class TestSignalGeneration:
     """Tests for entry signal generation logic"""
 
-    def test_strong_buy_signal(self, scenario_strong_buy):
+    def test_strong_buy_signal(self, scenario_strong_buy, analyzed_strong_buy):
         """Strong signals (drop + RSI + MA) should trigger entry"""
-        current_price, stats_24h, df = scenario_strong_buy
-
-        analysis = analyze_opportunity(
-            current_price=current_price,
-            stats_24h=stats_24h,
-            df_historical=df,
-            min_drop=5.0,
-            ma_distance=3.0,
-            rsi_oversold=30,
-            ma_period=7,
-            stop_loss=3.0,
-            take_profit=2.0,
-            max_take_profit=5.0,
-            resistance_factor=0.6
-        )
+        current_price = scenario_strong_buy[0]
+        analysis = analyzed_strong_buy
 
         # Should trigger entry signal
         assert analysis['entry_signal'] is True, "Strong signal should trigger entry"
@@ -36,8 +111,7 @@ class TestSignalGeneration:
         assert len(analysis['signals']) >= 1, "Should have at least one signal"
 
         # At minimum, should have the 24h drop signal (score +3)
-        drop_signal_found = any("24H DROP" in signal for signal in analysis['signals'])
-        assert drop_signal_found, "Should detect 24h drop signal"
+        assert "24H DROP" in _signal_kinds(analysis), "Should detect 24h drop signal"
 
         # Should have price and timestamp
         assert analysis['price'] == current_price
@@ -47,19 +121,7 @@ class TestSignalGeneration:
         """Weak conditions should not trigger entry signal"""
         current_price, stats_24h, df = scenario_no_signal
 
-        analysis = analyze_opportunity(
-            current_price=current_price,
-            stats_24h=stats_24h,
-            df_historical=df,
-            min_drop=5.0,
-            ma_distance=3.0,
-            rsi_oversold=30,
-            ma_period=7,
-            stop_loss=3.0,
-            take_profit=2.0,
-            max_take_profit=5.0,
-            resistance_factor=0.6
-        )
+        analysis = _analyze(current_price, stats_24h, df)
 
         # Should NOT trigger entry signal
         assert analysis['entry_signal'] is False, "Weak signal should not trigger entry"
@@ -69,49 +131,23 @@ class TestSignalGeneration:
         """Signal at minimum threshold (score=3) should trigger entry"""
         current_price, stats_24h, df = scenario_partial_signal
 
-        analysis = analyze_opportunity(
-            current_price=current_price,
-            stats_24h=stats_24h,
-            df_historical=df,
-            min_drop=5.0,
-            ma_distance=3.0,
-            rsi_oversold=30,
-            ma_period=7,
-            stop_loss=3.0,
-            take_profit=2.0,
-            max_take_profit=5.0,
-            resistance_factor=0.6
-        )
+        analysis = _analyze(current_price, stats_24h, df)
 
         # Should trigger entry signal (score=3 is minimum)
         assert analysis['entry_signal'] is True, "Score>=3 should trigger entry"
         assert analysis['score'] >= 3, f"Score should be >= 3, got {analysis['score']}"
 
         # Should have at least the drop signal
-        drop_signal_found = any("24H DROP" in signal for signal in analysis['signals'])
-        assert drop_signal_found, "Should detect 24h drop signal"
+        assert "24H DROP" in _signal_kinds(analysis), "Should detect 24h drop signal"
 
     def test_near_support_adds_bonus_score(self, scenario_near_support):
         """Price near support should add bonus point to score"""
         current_price, stats_24h, df = scenario_near_support
 
-        analysis = analyze_opportunity(
-            current_price=current_price,
-            stats_24h=stats_24h,
-            df_historical=df,
-            min_drop=5.0,
-            ma_distance=3.0,
-            rsi_oversold=30,
-            ma_period=7,
-            stop_loss=3.0,
-            take_profit=2.0,
-            max_take_profit=5.0,
-            resistance_factor=0.6
-        )
+        analysis = _analyze(current_price, stats_24h, df)
 
         # Check if near support signal is detected
-        near_support_detected = any("NEAR SUPPORT" in signal for signal in analysis['signals'])
-        assert near_support_detected, "Should detect near support level"
+        assert "NEAR SUPPORT" in _signal_kinds(analysis), "Should detect near support level"
 
 
 class TestTargetCalculation:
@@ -121,19 +157,7 @@ class TestTargetCalculation:
         """Target should use 60% distance to resistance, not full resistance"""
         current_price, stats_24h, df = scenario_conservative_target
 
-        analysis = analyze_opportunity(
-            current_price=current_price,
-            stats_24h=stats_24h,
-            df_historical=df,
-            min_drop=5.0,
-            ma_distance=3.0,
-            rsi_oversold=30,
-            ma_period=7,
-            stop_loss=3.0,
-            take_profit=2.0,
-            max_take_profit=5.0,
-            resistance_factor=0.6
-        )
+        analysis = _analyze(current_price, stats_24h, df)
 
         # Target should exist
         assert analysis['target_price'] is not None, "Target price should be calculated"
@@ -151,12 +175,11 @@ class TestTargetCalculation:
             f"Target should be at least {expected_min}, got {analysis['target_price']}"
 
         # Profit percent should be reasonable (2-5%)
-        assert 2.0 <= analysis['profit_percent'] <= 5.0, \
+        assert analysis['profit_percent'] == pytest.approx(3.5, abs=1.5), \
             f"Profit percent should be 2-5%, got {analysis['profit_percent']}"
 
     def test_target_respects_max_take_profit_cap(self):
         """Target should never exceed MAX_TAKE_PROFIT cap"""
-        from tests.conftest import create_price_with_indicators, create_mock_stats_24h
 
         current_price = 100000
         # Create scenario with very high resistance
@@ -168,19 +191,8 @@ class TestTargetCalculation:
         )
         stats_24h = create_mock_stats_24h(-6.0)
 
-        analysis = analyze_opportunity(
-            current_price=current_price,
-            stats_24h=stats_24h,
-            df_historical=df,
-            min_drop=5.0,
-            ma_distance=3.0,
-            rsi_oversold=30,
-            ma_period=7,
-            stop_loss=3.0,
-            take_profit=2.0,
-            max_take_profit=5.0,  # Should cap at 5%
-            resistance_factor=0.6
-        )
+        # DEFAULT_PARAMS caps the target at max_take_profit=5.0
+        analysis = _analyze(current_price, stats_24h, df)
 
         # Even with 20% resistance, should cap at 5%
         max_allowed = current_price * 1.05
@@ -191,38 +203,8 @@ class TestTargetCalculation:
 class TestStopLossCalculation:
     """Tests for stop loss calculation logic"""
 
-    def test_stop_loss_exists(self, scenario_strong_buy):
-        """Stop loss should always be calculated"""
-        current_price, stats_24h, df = scenario_strong_buy
-
-        analysis = analyze_opportunity(
-            current_price=current_price,
-            stats_24h=stats_24h,
-            df_historical=df,
-            min_drop=5.0,
-            ma_distance=3.0,
-            rsi_oversold=30,
-            ma_period=7,
-            stop_loss=3.0,
-            take_profit=2.0,
-            max_take_profit=5.0,
-            resistance_factor=0.6
-        )
-
-        assert analysis['stop_loss'] is not None, "Stop loss should be calculated"
-        assert analysis['stop_percent'] is not None, "Stop percent should be calculated"
-
-        # Stop loss should be below current price
-        assert analysis['stop_loss'] < current_price, \
-            "Stop loss should be below current price"
-
-        # Stop percent should be reasonable
-        assert 0 < analysis['stop_percent'] <= 6.0, \
-            f"Stop percent should be 0-6%, got {analysis['stop_percent']}"
-
     def test_stop_loss_reasonable_default(self):
         """Stop loss should default to configured percentage when no support"""
-        from tests.conftest import create_price_with_indicators, create_mock_stats_24h
 
         current_price = 100000
         # Create scenario with no nearby support
@@ -235,19 +217,8 @@ class TestStopLossCalculation:
         )
         stats_24h = create_mock_stats_24h(-6.0)
 
-        analysis = analyze_opportunity(
-            current_price=current_price,
-            stats_24h=stats_24h,
-            df_historical=df,
-            min_drop=5.0,
-            ma_distance=3.0,
-            rsi_oversold=30,
-            ma_period=7,
-            stop_loss=3.0,  # Should use this default
-            take_profit=2.0,
-            max_take_profit=5.0,
-            resistance_factor=0.6
-        )
+        # DEFAULT_PARAMS sets the default stop_loss=3.0
+        analysis = _analyze(current_price, stats_24h, df)
 
         # Should use either default percentage or nearest support (within 6% max)
         expected_stop_default = current_price * 0.97  # 3% stop loss
@@ -258,113 +229,114 @@ class TestStopLossCalculation:
             f"Stop loss should be between {max_stop} and {current_price}, got {analysis['stop_loss']}"
 
         # Stop percent should be reasonable
-        assert 0 < analysis['stop_percent'] <= 6.0, \
+        assert analysis['stop_percent'] > 0, f"Stop percent should be positive, got {analysis['stop_percent']}"
+        assert analysis['stop_percent'] == pytest.approx(3.0, abs=3.0), \
             f"Stop percent should be 0-6%, got {analysis['stop_percent']}"
 
-
-class TestRiskReward:
-    """Tests for risk/reward ratio validation"""
-
-    def test_risk_reward_ratio_is_favorable(self, scenario_strong_buy):
-        """Risk/reward ratio should be > 1.0 (preferably > 1.5)"""
+    def test_zero_stop_loss_renders_without_ratio(self, scenario_strong_buy):
+        """STOP_LOSS=0 should leave risk/reward undefined and render it as n/a"""
         current_price, stats_24h, df = scenario_strong_buy
 
         analysis = analyze_opportunity(
             current_price=current_price,
             stats_24h=stats_24h,
             df_historical=df,
-            min_drop=5.0,
-            ma_distance=3.0,
-            rsi_oversold=30,
-            ma_period=7,
-            stop_loss=3.0,
-            take_profit=2.0,
-            max_take_profit=5.0,
-            resistance_factor=0.6
+            **{**DEFAULT_PARAMS, "stop_loss": 0.0}
         )
 
-        # Both profit and stop should exist
-        assert analysis['profit_percent'] > 0, "Profit percent should be positive"
-        assert analysis['stop_percent'] > 0, "Stop percent should be positive"
+        assert analysis['stop_percent'] == 0
+        assert analysis['risk_reward'] is None
+        assert analysis['entry_signal'] is True
+
+        assert "RISK/REWARD: n/a" in format_analysis(analysis, DEFAULT_PARAMS['ma_period'])
+        assert "Risk/Reward: n/a" in format_trade_signal(analysis, "BTCUSDT", DEFAULT_PARAMS['ma_period'])
 
-        # Risk/reward calculation
-        risk_reward = analysis['profit_percent'] / analysis['stop_percent']
+        # Callers that predate the risk_reward key still get the ratio
+        legacy = {**analysis, 'stop_percent': 2.0}
+        del legacy['risk_reward']
+        expected = f"1:{analysis['profit_percent'] / 2.0:.2f}"
+        assert f"Risk/Reward: {expected}" in format_trade_signal(legacy, "BTCUSDT", DEFAULT_PARAMS['ma_period'])
 
-        # Risk/reward should exist (may vary based on support/resistance detection)
-        # Just verify the calculation makes sense
-        assert risk_reward > 0, f"Risk/reward should be positive, got {risk_reward:.2f}"
 
-        # Log the ratio for information (not a hard requirement in tests)
-        # In real scenarios, should aim for > 1.5
-        print(f"Risk/Reward ratio: {risk_reward:.2f}")
+class TestStrongBuyAnalysis:
+    """Field-level checks on the strong buy analysis (one analyze_opportunity call shared by all cases)"""
+
+    @pytest.mark.parametrize("check,predicate", STRONG_BUY_CHECKS,
+                             ids=[check for check, _ in STRONG_BUY_CHECKS])
+    def test_analysis_field(self, analyzed_strong_buy, check, predicate):
+        """Stop loss, risk/reward, MA, RSI and support/resistance values should be present and sane"""
+        assert predicate(analyzed_strong_buy), \
+            f"{check} check failed, got {analyzed_strong_buy.get(check)!r}"
 
 
 class TestIndicatorValues:
     """Tests for indicator calculations"""
 
-    def test_ma_distance_calculated(self, scenario_strong_buy):
-        """MA distance should be calculated and included in analysis"""
-        current_price, stats_24h, df = scenario_strong_buy
+    def test_rsi_matches_wilder_smoothing(self):
+        """RSI should follow Wilder smoothing, including intraday changes of the last close"""
 
-        analysis = analyze_opportunity(
-            current_price=current_price,
-            stats_24h=stats_24h,
-            df_historical=df,
-            min_drop=5.0,
-            ma_distance=3.0,
-            rsi_oversold=30,
-            ma_period=7,
-            stop_loss=3.0,
-            take_profit=2.0,
-            max_take_profit=5.0,
-            resistance_factor=0.6
-        )
+        prices = create_mock_historical_data(days=60, trend="volatile")['close']
 
-        assert 'ma' in analysis, "MA value should be in analysis"
-        assert 'ma_distance' in analysis, "MA distance should be in analysis"
-        assert analysis['ma'] > 0, "MA should be positive"
+        for live_close in (prices.iloc[-1], prices.iloc[-1] * 0.95):
+            series = prices.copy()
+            series.iloc[-1] = live_close
 
-    def test_rsi_calculated(self, scenario_strong_buy):
-        """RSI should be calculated and included in analysis"""
-        current_price, stats_24h, df = scenario_strong_buy
+            delta = series.diff()
+            avg_gain = delta.clip(lower=0).ewm(alpha=1 / 14, adjust=False).mean().iloc[-1]
+            avg_loss = (-delta).clip(lower=0).ewm(alpha=1 / 14, adjust=False).mean().iloc[-1]
+            expected = 100 * avg_gain / (avg_gain + avg_loss)
 
-        analysis = analyze_opportunity(
-            current_price=current_price,
-            stats_24h=stats_24h,
-            df_historical=df,
-            min_drop=5.0,
-            ma_distance=3.0,
-            rsi_oversold=30,
-            ma_period=7,
-            stop_loss=3.0,
-            take_profit=2.0,
-            max_take_profit=5.0,
-            resistance_factor=0.6
-        )
+            assert calculate_rsi(series, 14) == pytest.approx(expected), \
+                f"RSI should be {expected:.4f}, got {calculate_rsi(series, 14):.4f}"
 
-        assert 'rsi' in analysis, "RSI should be in analysis"
-        assert 0 <= analysis['rsi'] <= 100, \
-            f"RSI should be 0-100, got {analysis['rsi']}"
+    def test_rsi_matches_recorded_pandas_ta_values(self):
+        """RSI should match values recorded from pandas_ta 0.4.71b0 ta.rsi"""
+        closes = [100.0, 101.5, 100.8, 102.2, 103.0, 102.1, 101.4, 102.9, 104.3, 103.7,
+                  105.0, 104.2, 103.1, 104.8, 106.0, 105.3, 104.1, 103.5, 104.9, 106.2]
 
-    def test_support_resistance_levels_found(self, scenario_strong_buy):
-        """Support and resistance levels should be detected"""
-        current_price, stats_24h, df = scenario_strong_buy
+        assert calculate_rsi(closes, 14) == pytest.approx(75.21749607652953, rel=1e-12)
+        assert calculate_rsi(closes, 5) == pytest.approx(68.09460480360377, rel=1e-12)
+        # Shortest history with a value: period + 1 closes
+        assert calculate_rsi(closes[:15], 14) == pytest.approx(82.25085502781451, rel=1e-12)
 
-        analysis = analyze_opportunity(
-            current_price=current_price,
-            stats_24h=stats_24h,
-            df_historical=df,
-            min_drop=5.0,
-            ma_distance=3.0,
-            rsi_oversold=30,
-            ma_period=7,
-            stop_loss=3.0,
-            take_profit=2.0,
-            max_take_profit=5.0,
-            resistance_factor=0.6
-        )
 
-        assert 'supports' in analysis, "Supports should be in analysis"
-        assert 'resistances' in analysis, "Resistances should be in analysis"
-        assert len(analysis['supports']) > 0, "Should find support levels"
-        assert len(analysis['resistances']) > 0, "Should find resistance levels"
+class TestDropKernel:
+    """strongest_drops should match the pandas rolling(30, min_periods=1) reference"""
+
+    @pytest.mark.parametrize("days,levels", [(1, None), (2, None), (29, None), (30, None), (31, None),
+                                             (400, None), (400, 3), (45, 2)])
+    def test_matches_pandas_reference_on_random_series(self, days, levels):
+        """Codes and magnitudes should match, including series shorter than the window and ties"""
+        rng = np.random.default_rng(days * 10 + (levels or 0))
+        for _ in range(5):
+            close, high, low = _random_ohlc(rng, days, levels)
+            codes, best = strongest_drops(close, high, low, 30)
+            expected_codes, expected_best = _reference_drops(close, high, low)
+
+            np.testing.assert_array_equal(codes, expected_codes)
+            np.testing.assert_array_equal(best, expected_best)
+
+    @pytest.mark.parametrize("shape", ["increasing", "decreasing", "flat"])
+    def test_matches_pandas_reference_on_monotonic_series(self, shape):
+        """A falling high keeps every bar in the deque, so the window max must expire one bar at a time"""
+        steps = {"increasing": np.linspace(100, 200, 90), "decreasing": np.linspace(200, 100, 90),
+                 "flat": np.full(90, 100.0)}[shape]
+        close, high, low = steps, steps * 1.02, steps * 0.97
+
+        codes, best = strongest_drops(close, high, low, 30)
+        expected_codes, expected_best = _reference_drops(close, high, low)
+
+        np.testing.assert_array_equal(codes, expected_codes)
+        np.testing.assert_array_equal(best, expected_best)
+
+    def test_exact_ties_go_to_lowest_code(self):
+        """When all three methods give the same drop, close-to-close (code 0) wins; then drawdown (1)"""
+        close = np.array([100.0, 50.0])
+        high = np.array([100.0, 100.0])
+        low = np.array([50.0, 50.0])
+
+        codes, best = strongest_drops(close, high, low, 30)
+
+        # Day 0: no previous close, drawdown and intraday tie at -50%
+        np.testing.assert_array_equal(codes, [1, 0])
+        np.testing.assert_array_equal(best, [-50.0, -50.0])
@@ -3,6 +3,7 @@ Test Telegram Notification
 Simple script to test if your Telegram bot is configured correctly
 """
 
+import asyncio
 import pytest
 from btc_monitor.telegram_bot import TelegramNotifier
 from btc_monitor import settings
@@ -40,7 +41,8 @@ async def test_telegram():
     print(format_init_bot())
     notifier = TelegramNotifier(settings.TELEGRAM_BOT_TOKEN, settings.TELEGRAM_CHAT_ID)
 
-    if not notifier.is_enabled():
+    # Build the Bot now so a bad token is reported here, not on the first send
+    if not await notifier.connect():
         print(format_bot_init_failed())
         return
 
@@ -56,7 +58,7 @@ async def test_telegram():
 
 
 def main():
-    run(test_telegram())
+    asyncio.run(test_telegram())
 
 
 if __name__ == "__main__":